@@ -17,15 +17,12 @@
 import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import sessionmaker
 
 from models.base import Base
 from models import user  # all models must be imported
-from database.dbconfig import SQLALCHEMY_DATABASE_URL
-
-# Create engine
-engine = create_async_engine(SQLALCHEMY_DATABASE_URL, echo=True)
+from database.dbconfig import engine  # single shared engine / pool
 
 # Create session
 async_session = sessionmaker(
@@ -39,8 +36,12 @@ async def get_session() -> AsyncSession:
     async with async_session() as session:
         yield session
 
-# Function to create tables on app startup
-async def init_db():
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+def load_models():
+    # every model module, so Base.metadata describes the whole schema
+    from models import user, course, purchased_courses, add_to_cart  # noqa: F401
 
+# Schema changes are versioned migrations (database/migrate.py); the app only
+# checks the schema version at startup.
+async def check_schema():
+    from database.migrate import verify_schema_version
+    return await verify_schema_version(engine)
@@ -0,0 +1,165 @@
+#####################################################################
+## Schema migrations
+#####################################################################
+
+# Versioned migration scripts live in database/migrations as
+# NNNN_description.py, each with an `async def upgrade(conn)`. Applied
+# versions are recorded in schema_migrations. Run pending migrations with
+#
+#     python -m database.migrate            # apply everything pending
+#     python -m database.migrate status     # show applied / pending
+#
+# Migrations run one at a time in their own transaction, under a session
+# advisory lock so two deploys can never apply the same script twice. A
+# script that must run outside a transaction (CREATE INDEX CONCURRENTLY)
+# sets TRANSACTIONAL = False.
+#
+# The app itself never migrates: at startup it only checks that the
+# database is at the version this code expects (verify_schema_version).
+
+import asyncio
+import importlib.util
+import os
+import re
+import sys
+from dataclasses import dataclass
+from typing import List, Optional
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import text
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "migrations")
+MIGRATION_LOCK_KEY = 0x6B617364  # "kasd"
+_FILENAME = re.compile(r"^(\d{4})_(\w+)\.py$")
+
+
+class SchemaVersionError(RuntimeError):
+    pass
+
+
+@dataclass
+class Migration:
+    version: int
+    name: str
+    path: str
+
+    def load(self):
+        spec = importlib.util.spec_from_file_location(f"migration_{self.version:04d}", self.path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+
+def discover(directory: str = MIGRATIONS_DIR) -> List[Migration]:
+    migrations = []
+    for filename in sorted(os.listdir(directory)):
+        match = _FILENAME.match(filename)
+        if match:
+            migrations.append(Migration(int(match.group(1)), match.group(2), os.path.join(directory, filename)))
+    versions = [m.version for m in migrations]
+    if len(versions) != len(set(versions)):
+        raise SchemaVersionError(f"duplicate migration versions in {directory}")
+    return migrations
+
+
+def head_version(directory: str = MIGRATIONS_DIR) -> int:
+    migrations = discover(directory)
+    return migrations[-1].version if migrations else 0
+
+
+async def run_sql(conn, *statements):
+    """Execute statements one by one (asyncpg rejects multi-statement strings)."""
+    for statement in statements:
+        await conn.execute(text(statement))
+
+
+async def _ensure_version_table(conn):
+    await conn.execute(text(
+        "CREATE TABLE IF NOT EXISTS schema_migrations ("
+        " version INTEGER PRIMARY KEY,"
+        " name VARCHAR NOT NULL,"
+        " applied_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now())"
+    ))
+
+
+async def applied_versions(conn) -> List[int]:
+    exists = await conn.scalar(text("SELECT to_regclass('schema_migrations') IS NOT NULL"))
+    if not exists:
+        return []
+    result = await conn.execute(text("SELECT version FROM schema_migrations ORDER BY version"))
+    return [row[0] for row in result]
+
+
+async def migrate(engine, target: Optional[int] = None, directory: str = MIGRATIONS_DIR) -> List[Migration]:
+    """Apply pending migrations up to `target` (default: all). Returns what was applied."""
+    applied_now = []
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+        await conn.commit()
+        try:
+            await _ensure_version_table(conn)
+            await conn.commit()
+            done = set(await applied_versions(conn))
+            await conn.commit()
+
+            for migration in discover(directory):
+                if migration.version in done or (target is not None and migration.version > target):
+                    continue
+                module = migration.load()
+                record = text("INSERT INTO schema_migrations (version, name) VALUES (:version, :name)")
+                params = {"version": migration.version, "name": migration.name}
+
+                if getattr(module, "TRANSACTIONAL", True):
+                    async with conn.begin():
+                        await module.upgrade(conn)
+                        await conn.execute(record, params)
+                else:
+                    async with engine.connect() as autocommit:
+                        autocommit = await autocommit.execution_options(isolation_level="AUTOCOMMIT")
+                        await module.upgrade(autocommit)
+                        await autocommit.execute(record, params)
+                applied_now.append(migration)
+        finally:
+            await conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": MIGRATION_LOCK_KEY})
+            await conn.commit()
+    return applied_now
+
+
+async def verify_schema_version(engine, directory: str = MIGRATIONS_DIR) -> int:
+    """Boot-time check: one query, raises SchemaVersionError if migrations are pending."""
+    expected = head_version(directory)
+    async with engine.connect() as conn:
+        versions = await applied_versions(conn)
+    current = versions[-1] if versions else 0
+    if current < expected:
+        raise SchemaVersionError(
+            f"database schema is at version {current}, this build expects {expected}; "
+            f"run `python -m database.migrate` first"
+        )
+    return current
+
+
+async def _main(argv):
+    from database.dbconfig import engine
+
+    try:
+        if argv[:1] == ["status"]:
+            async with engine.connect() as conn:
+                done = set(await applied_versions(conn))
+            for migration in discover():
+                state = "applied" if migration.version in done else "pending"
+                print(f"{migration.version:04d} {migration.name:<40} {state}")
+            return
+
+        target = int(argv[0]) if argv else None
+        applied = await migrate(engine, target)
+        for migration in applied:
+            print(f"applied {migration.version:04d} {migration.name}")
+        print("schema up to date" if not applied else f"{len(applied)} migration(s) applied")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(_main(sys.argv[1:]))
@@ -0,0 +1,253 @@
+"""Baseline: the schema as Base.metadata.create_all built it before migrations.
+
+Every statement is idempotent, so databases created by the old startup
+create_all adopt this version without changes.
+"""
+
+from database.migrate import run_sql
+
+ROLE_ENUM = """
+    DO $$ BEGIN
+        CREATE TYPE roleenum AS ENUM ('student', 'instructor');
+    EXCEPTION WHEN duplicate_object THEN NULL;
+    END $$
+"""
+
+STATEMENTS = [
+    """
+    CREATE TABLE IF NOT EXISTS users (
+        id SERIAL NOT NULL,
+        name VARCHAR NOT NULL,
+        email VARCHAR NOT NULL,
+        phone_no VARCHAR NOT NULL,
+        created_at DATE,
+        password VARCHAR NOT NULL,
+        role roleenum NOT NULL,
+        PRIMARY KEY (id),
+        UNIQUE (email),
+        UNIQUE (phone_no)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS courses (
+        id SERIAL NOT NULL,
+        instructor_id INTEGER NOT NULL,
+        title VARCHAR NOT NULL,
+        description VARCHAR NOT NULL,
+        duration VARCHAR NOT NULL,
+        thumbnail_url VARCHAR,
+        created_at DATE,
+        PRIMARY KEY (id),
+        FOREIGN KEY(instructor_id) REFERENCES users (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS tokens (
+        user_id INTEGER NOT NULL,
+        access_token VARCHAR(450),
+        refresh_token VARCHAR(450) NOT NULL,
+        status BOOLEAN,
+        created_at DATE,
+        PRIMARY KEY (user_id),
+        FOREIGN KEY(user_id) REFERENCES users (id),
+        UNIQUE (access_token)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS add_to_cart (
+        id SERIAL NOT NULL,
+        student_id INTEGER,
+        course_id INTEGER,
+        added_at TIMESTAMP WITHOUT TIME ZONE,
+        PRIMARY KEY (id),
+        FOREIGN KEY(student_id) REFERENCES users (id) ON DELETE CASCADE,
+        FOREIGN KEY(course_id) REFERENCES courses (id) ON DELETE CASCADE
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_add_to_cart_id ON add_to_cart (id)",
+    """
+    CREATE TABLE IF NOT EXISTS batches (
+        id SERIAL NOT NULL,
+        course_id INTEGER NOT NULL,
+        batch_name VARCHAR NOT NULL,
+        num_students INTEGER NOT NULL,
+        instructor_id INTEGER NOT NULL,
+        timing VARCHAR,
+        start_date DATE NOT NULL,
+        end_date DATE NOT NULL,
+        created_at DATE,
+        PRIMARY KEY (id),
+        FOREIGN KEY(course_id) REFERENCES courses (id),
+        FOREIGN KEY(instructor_id) REFERENCES users (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS course_enrollment_counts (
+        course_id INTEGER NOT NULL,
+        enrollments INTEGER DEFAULT '0' NOT NULL,
+        updated_at TIMESTAMP WITHOUT TIME ZONE,
+        PRIMARY KEY (course_id),
+        FOREIGN KEY(course_id) REFERENCES courses (id) ON DELETE CASCADE
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS lessons (
+        id SERIAL NOT NULL,
+        instructor_id INTEGER NOT NULL,
+        course_id INTEGER NOT NULL,
+        lesson_title VARCHAR NOT NULL,
+        description VARCHAR NOT NULL,
+        created_at DATE,
+        PRIMARY KEY (id),
+        FOREIGN KEY(instructor_id) REFERENCES users (id),
+        FOREIGN KEY(course_id) REFERENCES courses (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_lessons_id ON lessons (id)",
+    """
+    CREATE TABLE IF NOT EXISTS purchased_courses (
+        id SERIAL NOT NULL,
+        student_id INTEGER NOT NULL,
+        course_id INTEGER NOT NULL,
+        purchased_at TIMESTAMP WITHOUT TIME ZONE,
+        PRIMARY KEY (id),
+        FOREIGN KEY(student_id) REFERENCES users (id),
+        FOREIGN KEY(course_id) REFERENCES courses (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS batch_lesson_activation (
+        id SERIAL NOT NULL,
+        batch_id INTEGER NOT NULL,
+        lesson_id INTEGER NOT NULL,
+        activated_by INTEGER,
+        activated_at TIMESTAMP WITH TIME ZONE DEFAULT now(),
+        PRIMARY KEY (id),
+        CONSTRAINT unique_batch_lesson UNIQUE (batch_id, lesson_id),
+        FOREIGN KEY(batch_id) REFERENCES batches (id) ON DELETE CASCADE,
+        FOREIGN KEY(lesson_id) REFERENCES lessons (id) ON DELETE CASCADE,
+        FOREIGN KEY(activated_by) REFERENCES users (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_batch_lesson_activation_id ON batch_lesson_activation (id)",
+    """
+    CREATE TABLE IF NOT EXISTS batch_students (
+        id SERIAL NOT NULL,
+        student_id INTEGER NOT NULL,
+        batch_id INTEGER NOT NULL,
+        course_id INTEGER NOT NULL,
+        batch_name VARCHAR,
+        PRIMARY KEY (id),
+        CONSTRAINT unique_student_course_assignment UNIQUE (student_id, course_id),
+        FOREIGN KEY(student_id) REFERENCES users (id) ON DELETE CASCADE,
+        FOREIGN KEY(batch_id) REFERENCES batches (id) ON DELETE CASCADE,
+        FOREIGN KEY(course_id) REFERENCES courses (id) ON DELETE CASCADE
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_batch_students_id ON batch_students (id)",
+    """
+    CREATE TABLE IF NOT EXISTS course_calendar (
+        id SERIAL NOT NULL,
+        course_id INTEGER,
+        batch_id INTEGER,
+        lesson_id INTEGER,
+        select_date DATE,
+        day VARCHAR NOT NULL,
+        start_time VARCHAR,
+        end_time VARCHAR,
+        PRIMARY KEY (id),
+        FOREIGN KEY(course_id) REFERENCES courses (id) ON DELETE CASCADE,
+        FOREIGN KEY(batch_id) REFERENCES batches (id) ON DELETE CASCADE,
+        FOREIGN KEY(lesson_id) REFERENCES lessons (id) ON DELETE CASCADE
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_course_calendar_id ON course_calendar (id)",
+    """
+    CREATE TABLE IF NOT EXISTS labs (
+        id SERIAL NOT NULL,
+        course_id INTEGER,
+        lesson_id INTEGER,
+        name VARCHAR NOT NULL,
+        description VARCHAR,
+        url VARCHAR,
+        file_url VARCHAR,
+        PRIMARY KEY (id),
+        FOREIGN KEY(course_id) REFERENCES courses (id),
+        FOREIGN KEY(lesson_id) REFERENCES lessons (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_labs_id ON labs (id)",
+    """
+    CREATE TABLE IF NOT EXISTS meeting_links (
+        id SERIAL NOT NULL,
+        instructor_id INTEGER,
+        course_id INTEGER,
+        batch_id INTEGER,
+        meeting_url VARCHAR(255) NOT NULL,
+        PRIMARY KEY (id),
+        FOREIGN KEY(instructor_id) REFERENCES users (id) ON DELETE CASCADE,
+        FOREIGN KEY(course_id) REFERENCES courses (id) ON DELETE CASCADE,
+        FOREIGN KEY(batch_id) REFERENCES batches (id) ON DELETE CASCADE
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_meeting_links_id ON meeting_links (id)",
+    """
+    CREATE TABLE IF NOT EXISTS notes (
+        id SERIAL NOT NULL,
+        course_id INTEGER NOT NULL,
+        lesson_id INTEGER NOT NULL,
+        instructor_id INTEGER NOT NULL,
+        notes TEXT NOT NULL,
+        PRIMARY KEY (id),
+        FOREIGN KEY(course_id) REFERENCES courses (id) ON DELETE CASCADE,
+        FOREIGN KEY(lesson_id) REFERENCES lessons (id) ON DELETE CASCADE,
+        FOREIGN KEY(instructor_id) REFERENCES users (id) ON DELETE CASCADE
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_notes_id ON notes (id)",
+    """
+    CREATE TABLE IF NOT EXISTS pdfs (
+        id SERIAL NOT NULL,
+        course_id INTEGER NOT NULL,
+        lesson_id INTEGER NOT NULL,
+        file_url VARCHAR NOT NULL,
+        created_at DATE,
+        PRIMARY KEY (id),
+        FOREIGN KEY(course_id) REFERENCES courses (id),
+        FOREIGN KEY(lesson_id) REFERENCES lessons (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_pdfs_id ON pdfs (id)",
+    """
+    CREATE TABLE IF NOT EXISTS quiz (
+        id SERIAL NOT NULL,
+        course_id INTEGER NOT NULL,
+        lesson_id INTEGER NOT NULL,
+        name VARCHAR NOT NULL,
+        description VARCHAR,
+        url VARCHAR,
+        file_url VARCHAR,
+        PRIMARY KEY (id),
+        FOREIGN KEY(course_id) REFERENCES courses (id),
+        FOREIGN KEY(lesson_id) REFERENCES lessons (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_quiz_id ON quiz (id)",
+    """
+    CREATE TABLE IF NOT EXISTS weblinks (
+        id SERIAL NOT NULL,
+        course_id INTEGER NOT NULL,
+        lesson_id INTEGER NOT NULL,
+        link_url VARCHAR NOT NULL,
+        created_at DATE,
+        PRIMARY KEY (id),
+        FOREIGN KEY(course_id) REFERENCES courses (id),
+        FOREIGN KEY(lesson_id) REFERENCES lessons (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_weblinks_id ON weblinks (id)",
+]
+
+
+async def upgrade(conn):
+    await run_sql(conn, ROLE_ENUM, *STATEMENTS)
@@ -0,0 +1,65 @@
+"""Secondary indexes for the hot foreign-key filters.
+
+Each index follows a WHERE clause the app actually runs (plus its ORDER BY
+where the query sorts):
+
+  pdfs / weblinks / quiz / labs / notes
+                   lesson_id = ? ORDER BY id          lesson bundle, notes
+  lessons          course_id = ? ORDER BY id          lessons by course
+  course_calendar  course_id | batch_id = ?
+                   ORDER BY select_date, start_time   calendar views
+  purchased_courses student_id = ? [AND course_id = ?]
+                   course_id = ?                      roster, counter reconcile
+  add_to_cart      student_id = ? AND course_id = ?   cart lookup, buy
+  batches          course_id = ?                      batches of a course
+  batch_students   batch_id = ?                       batch roster, cascades
+                   (student_id / (student_id, course_id) is already covered
+                   by unique_student_course_assignment)
+  meeting_links    batch_id = ? / instructor_id = ?
+  courses          instructor_id = ? ORDER BY id      catalogue filter + keyset
+
+The indexes are built CONCURRENTLY so the tables keep taking writes, which
+cannot happen inside a transaction. A concurrent build that dies half-way
+leaves an INVALID index that IF NOT EXISTS would then skip, so any such
+leftover is dropped before building.
+"""
+
+from sqlalchemy import text
+
+from database.migrate import run_sql
+
+TRANSACTIONAL = False
+
+INDEXES = {
+    "ix_pdfs_lesson_id_id": "pdfs (lesson_id, id)",
+    "ix_weblinks_lesson_id_id": "weblinks (lesson_id, id)",
+    "ix_quiz_lesson_id_id": "quiz (lesson_id, id)",
+    "ix_labs_lesson_id_id": "labs (lesson_id, id)",
+    "ix_notes_lesson_id_id": "notes (lesson_id, id)",
+    "ix_lessons_course_id_id": "lessons (course_id, id)",
+    "ix_course_calendar_course_schedule": "course_calendar (course_id, select_date, start_time)",
+    "ix_course_calendar_batch_schedule": "course_calendar (batch_id, select_date, start_time)",
+    "ix_purchased_courses_student_course": "purchased_courses (student_id, course_id)",
+    "ix_purchased_courses_course_id": "purchased_courses (course_id)",
+    "ix_add_to_cart_student_course": "add_to_cart (student_id, course_id)",
+    "ix_batches_course_id": "batches (course_id)",
+    "ix_batch_students_batch_id": "batch_students (batch_id)",
+    "ix_meeting_links_batch_id": "meeting_links (batch_id)",
+    "ix_meeting_links_instructor_id": "meeting_links (instructor_id)",
+    "ix_courses_instructor_id_id": "courses (instructor_id, id)",
+}
+
+
+async def upgrade(conn):
+    invalid = await conn.execute(
+        text(
+            "SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE NOT i.indisvalid AND c.relname = ANY(:names)"
+        ),
+        {"names": list(INDEXES)},
+    )
+    await run_sql(conn, *[f"DROP INDEX CONCURRENTLY IF EXISTS {name}" for (name,) in invalid.all()])
+    await run_sql(conn, *[
+        f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {target}"
+        for name, target in INDEXES.items()
+    ])
@@ -0,0 +1,107 @@
+#####################################################################
+## Structured, sampled SQL query log
+#####################################################################
+
+# Replaces `echo=True` on the engine. Nothing is attached unless
+# QUERY_LOG_ENABLED is set, so the default cost is zero. When enabled, each
+# statement is timed and written as one JSON line:
+#
+#   {"event": "sql", "fingerprint": "3f2a9c1d0b7e", "duration_ms": 4.21,
+#    "rows": 12, "slow": false, "statement": "SELECT ... WHERE id = ?"}
+#
+# Statements at or above QUERY_LOG_SLOW_MS are always logged; the rest are
+# logged with probability QUERY_LOG_SAMPLE_RATE.
+
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import time
+
+from sqlalchemy import event
+
+QUERY_LOG_ENABLED = (os.getenv("QUERY_LOG_ENABLED") or "false").lower() in ("1", "true", "yes")
+QUERY_LOG_SAMPLE_RATE = float(os.getenv("QUERY_LOG_SAMPLE_RATE") or 0.01)
+QUERY_LOG_SLOW_MS = float(os.getenv("QUERY_LOG_SLOW_MS") or 200)
+QUERY_LOG_MAX_STATEMENT_CHARS = int(os.getenv("QUERY_LOG_MAX_STATEMENT_CHARS") or 2000)
+
+logger = logging.getLogger("kasadra.query")
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_BIND_PARAM = re.compile(r"\$\d+(?:::[A-Z_]+(?:\[\])?)?|%\([^)]+\)s|(?<!:):\w+|\?")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_statement(statement: str) -> str:
+    """Strip literals and bind markers so equivalent queries compare equal."""
+    sql = _STRING_LITERAL.sub("?", statement)
+    sql = _BIND_PARAM.sub("?", sql)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    sql = _IN_LIST.sub("IN (...)", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+def _hash(normalized: str) -> str:
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:12]
+
+
+def fingerprint(statement: str) -> str:
+    return _hash(normalize_statement(statement))
+
+
+def _row_count(cursor):
+    if cursor.rowcount is not None and cursor.rowcount >= 0:
+        return cursor.rowcount
+    # Buffered async cursors (asyncpg) hold the fetched rows before the
+    # result object consumes them; server-side cursors report nothing.
+    rows = getattr(cursor, "_rows", None)
+    return len(rows) if rows is not None else None
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_log_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get("query_log_start")
+    if not started:
+        return
+    duration_ms = (time.perf_counter() - started.pop()) * 1000
+
+    slow = QUERY_LOG_SLOW_MS > 0 and duration_ms >= QUERY_LOG_SLOW_MS
+    if not slow and random.random() >= QUERY_LOG_SAMPLE_RATE:
+        return
+
+    normalized = normalize_statement(statement)
+    record = {
+        "event": "sql",
+        "fingerprint": _hash(normalized),
+        "duration_ms": round(duration_ms, 3),
+        "rows": _row_count(cursor),
+        "slow": slow,
+        "executemany": executemany,
+        "statement": normalized[:QUERY_LOG_MAX_STATEMENT_CHARS],
+    }
+    logger.log(logging.WARNING if slow else logging.INFO, json.dumps(record))
+
+
+def install_query_log(engine) -> bool:
+    """Attach the query log to an (async) engine when it is enabled."""
+    if not QUERY_LOG_ENABLED:
+        return False
+
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+
+    sync_engine = getattr(engine, "sync_engine", engine)
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    return True
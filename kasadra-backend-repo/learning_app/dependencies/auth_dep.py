@@ -1,3 +1,4 @@
+import os
 from typing import Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
@@ -6,9 +7,30 @@ from sqlalchemy.future import select
 from models.user import User
 from database.db import get_session
 from utils.auth import verify_access_token
+from utils.cache import TTLCache
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/login")
 
+# Verified principals keyed by user id. The token itself is still verified on
+# every request; only the users-table lookup is cached. Anything that changes
+# a user must call invalidate_principal().
+AUTH_CACHE_TTL_SECONDS = float(os.getenv("AUTH_CACHE_TTL_SECONDS") or 60)
+AUTH_CACHE_MAX_ENTRIES = int(os.getenv("AUTH_CACHE_MAX_ENTRIES") or 10000)
+
+principal_cache = TTLCache("principals", AUTH_CACHE_TTL_SECONDS, AUTH_CACHE_MAX_ENTRIES)
+
+_PRINCIPAL_FIELDS = ("id", "name", "email", "phone_no", "created_at", "role")
+
+
+def invalidate_principal(user_id: int):
+    principal_cache.invalidate(user_id)
+
+
+def _principal_from_cache(user_id: int) -> Optional[User]:
+    snapshot = principal_cache.get(user_id)
+    # Hand out a fresh, session-less User so callers can't mutate the cache
+    return User(**snapshot) if snapshot else None
+
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
@@ -30,6 +52,10 @@ async def get_current_user(
             detail={"status": "error", "message": "Invalid token payload", "data": {}}
         )
 
+    user = _principal_from_cache(user_id)
+    if user is not None:
+        return user
+
     stmt = select(User).where(User.id == user_id)
     result = await db.execute(stmt)
     user = result.scalar_one_or_none()
@@ -40,6 +66,7 @@ async def get_current_user(
             detail={"status": "error", "message": "User not found", "data": {}}
         )
 
+    principal_cache.set(user_id, {field: getattr(user, field) for field in _PRINCIPAL_FIELDS})
     return user
 
 
@@ -1,5 +1,6 @@
 import os
 import sys
+import asyncio
 import uvicorn
 from fastapi import FastAPI, Request
 from starlette.middleware.cors import CORSMiddleware
@@ -17,7 +18,11 @@ sys.path.append(os.path.join(root_dir, "models"))
 sys.path.append(os.path.join(root_dir, "routes"))
 sys.path.append(os.path.join(root_dir, "data"))
 
-from database.dbconfig import engine
+from database.dbconfig import engine, pool_stats
+from dependencies.auth_dep import principal_cache
+from utils.passwd import password_pool_stats
+from services.enrollment_counts import ENROLLMENT_RECONCILE_SECONDS, run_reconcile_loop
+from services.catalog_cache import catalog_cache
 
 from routes import student
 from routes import instructor
@@ -68,11 +73,6 @@ app.add_middleware(
 )
 
 
-@app.on_event("startup")
-async def on_startup():
-    # Create the database tables.
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
 @app.exception_handler(Exception)
 async def universal_exception_handler(request, exc):
     return JSONResponse(
@@ -85,18 +85,52 @@ async def universal_exception_handler(request, exc):
 
 ## Owner= Akhilesh ML
 
-from database.db import init_db  # NOT from models.base
+from database.db import check_schema, async_session  # NOT from models.base
 
 ## health check
 @app.get("/api")
 async def health_check():
     return {"status": "ok"}
 
+## DB connection pool metrics
+@app.get("/api/health/db-pool")
+async def db_pool_health():
+    return {"status": "ok", "data": pool_stats()}
+
+## Auth principal cache metrics
+@app.get("/api/health/auth-cache")
+async def auth_cache_health():
+    return {"status": "ok", "data": principal_cache.stats()}
+
+## Password hashing pool metrics
+@app.get("/api/health/password-pool")
+async def password_pool_health():
+    return {"status": "ok", "data": password_pool_stats()}
+
+## Catalogue read cache metrics
+@app.get("/api/health/catalog-cache")
+async def catalog_cache_health():
+    return {"status": "ok", "data": catalog_cache.stats()}
+
 
-## DB setup
+## DB setup: refuse to start on an unmigrated schema (python -m database.migrate)
 @app.on_event("startup")
 async def startup_event():
-    await init_db()
+    await check_schema()
+
+
+## Enrollment counter reconcile (backfills on first start, then repairs drift)
+_background_tasks = []
+
+@app.on_event("startup")
+async def start_enrollment_reconcile():
+    if ENROLLMENT_RECONCILE_SECONDS > 0:
+        _background_tasks.append(asyncio.create_task(run_reconcile_loop(async_session)))
+
+@app.on_event("shutdown")
+async def stop_background_tasks():
+    for task in _background_tasks:
+        task.cancel()
 
 
 @app.exception_handler(RequestValidationError)
@@ -123,6 +157,7 @@ async def custom_validation_handler(request: Request, exc: RequestValidationErro
         }
     )
 
+# Local development only; production runs `python serve.py`
 if __name__ == "__main__":
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
 
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from database.db import Base
@@ -13,3 +13,7 @@ class Cart(Base):
 
     student = relationship("User", back_populates="cart_items")
     course = relationship("Course", back_populates="cart_entries")
+
+    __table_args__ = (
+        Index("ix_add_to_cart_student_course", "student_id", "course_id"),
+    )
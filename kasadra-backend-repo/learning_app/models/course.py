@@ -3,7 +3,7 @@ from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from datetime import date
 from models.user import User
-from sqlalchemy import Time,  UniqueConstraint
+from sqlalchemy import Time,  UniqueConstraint, Index
 
 from .base import Base
 
@@ -30,6 +30,10 @@ class Course(Base):
     meetings = relationship("MeetingLink", back_populates="course", cascade="all, delete")
     notes = relationship("Note", back_populates="course", cascade="all, delete")
 
+    __table_args__ = (
+        Index("ix_courses_instructor_id_id", "instructor_id", "id"),
+    )
+
 class Lesson(Base):
     __tablename__ = "lessons"
 
@@ -49,6 +53,10 @@ class Lesson(Base):
     labs = relationship("Lab", back_populates="lesson", cascade="all, delete-orphan")
     notes = relationship("Note", back_populates="lesson", cascade="all, delete")
 
+    __table_args__ = (
+        Index("ix_lessons_course_id_id", "course_id", "id"),
+    )
+
 class Batch(Base):
     __tablename__ = "batches"
 
@@ -67,6 +75,10 @@ class Batch(Base):
     calendar_entries = relationship("CourseCalendar", back_populates="batch", cascade="all, delete-orphan")
     meetings = relationship("MeetingLink", back_populates="batch", cascade="all, delete")
 
+    __table_args__ = (
+        Index("ix_batches_course_id", "course_id"),
+    )
+
 class BatchStudent(Base):
     __tablename__ = "batch_students"
 
@@ -79,6 +91,7 @@ class BatchStudent(Base):
     # 🔥 A student can only have ONE batch per course, not globally
     __table_args__ = (
         UniqueConstraint("student_id", "course_id", name="unique_student_course_assignment"),
+        Index("ix_batch_students_batch_id", "batch_id"),
     )
 
     batch = relationship("Batch")
@@ -102,6 +115,11 @@ class CourseCalendar(Base):
     batch = relationship("Batch", back_populates="calendar_entries")
     lesson = relationship("Lesson")
 
+    __table_args__ = (
+        Index("ix_course_calendar_course_schedule", "course_id", "select_date", "start_time"),
+        Index("ix_course_calendar_batch_schedule", "batch_id", "select_date", "start_time"),
+    )
+
 class MeetingLink(Base):
     __tablename__ = "meeting_links"
 
@@ -116,6 +134,11 @@ class MeetingLink(Base):
     course = relationship("Course", back_populates="meetings")
     batch = relationship("Batch", back_populates="meetings")
 
+    __table_args__ = (
+        Index("ix_meeting_links_batch_id", "batch_id"),
+        Index("ix_meeting_links_instructor_id", "instructor_id"),
+    )
+
 
 class Pdf(Base):
     __tablename__ = "pdfs"
@@ -129,6 +152,10 @@ class Pdf(Base):
     course = relationship("Course", back_populates="pdfs")
     lesson = relationship("Lesson", back_populates="pdfs")
 
+    __table_args__ = (
+        Index("ix_pdfs_lesson_id_id", "lesson_id", "id"),
+    )
+
 
 class WebLink(Base):
     __tablename__ = "weblinks"
@@ -141,6 +168,10 @@ class WebLink(Base):
 
     course = relationship("Course", back_populates="weblinks")
     lesson = relationship("Lesson", back_populates="weblinks")
+
+    __table_args__ = (
+        Index("ix_weblinks_lesson_id_id", "lesson_id", "id"),
+    )
   
 
 class Quiz(Base):
@@ -156,6 +187,10 @@ class Quiz(Base):
     course = relationship("Course", back_populates="quizzes")
     lesson = relationship("Lesson", back_populates="quizzes")
 
+    __table_args__ = (
+        Index("ix_quiz_lesson_id_id", "lesson_id", "id"),
+    )
+
 class Lab(Base):
     __tablename__ = "labs"
     id = Column(Integer, primary_key=True, index=True)
@@ -169,6 +204,10 @@ class Lab(Base):
     course = relationship("Course", back_populates="labs")
     lesson = relationship("Lesson", back_populates="labs")
 
+    __table_args__ = (
+        Index("ix_labs_lesson_id_id", "lesson_id", "id"),
+    )
+
 class Note(Base):
     __tablename__ = "notes"
 
@@ -183,6 +222,10 @@ class Note(Base):
     lesson = relationship("Lesson", back_populates="notes", lazy="joined")
     instructor = relationship("User")
 
+    __table_args__ = (
+        Index("ix_notes_lesson_id_id", "lesson_id", "id"),
+    )
+
 ###########################################
 ## BatchLessonActivation
 ###########################################
@@ -203,17 +246,3 @@ class BatchLessonActivation(Base):
     __table_args__ = (
     UniqueConstraint('batch_id', 'lesson_id', name='unique_batch_lesson'),
 )
-    
-#### n8n test
-
-from sqlalchemy import Column, Integer, String
-from sqlalchemy.ext.declarative import declarative_base
-
-Base = declarative_base()
-
-class Course(Base):
-    __tablename__ = 'courses'
-
-    id = Column(Integer, primary_key=True, index=True)
-    new_course = Column(String, index=True)
-    instructor_name = Column(String, index=True)
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from database.db import Base
 from datetime import datetime
@@ -13,3 +13,22 @@ class PurchasedCourse(Base):
 
     student = relationship("User")
     course = relationship("Course")
+
+    __table_args__ = (
+        Index("ix_purchased_courses_student_course", "student_id", "course_id"),
+        Index("ix_purchased_courses_course_id", "course_id"),
+    )
+
+
+class CourseEnrollmentCount(Base):
+    """Maintained count of purchased_courses rows per course.
+
+    Bumped in the same transaction as each purchase and repaired by
+    services.enrollment_counts.reconcile_enrollment_counts, so catalogue
+    reads never aggregate purchased_courses.
+    """
+    __tablename__ = "course_enrollment_counts"
+
+    course_id = Column(Integer, ForeignKey("courses.id", ondelete="CASCADE"), primary_key=True)
+    enrollments = Column(Integer, nullable=False, default=0, server_default="0")
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -21,6 +21,7 @@ from schemas.course import BatchCreate
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import joinedload
 from schemas.batch import AssignStudentsRequest
+from services.batch_assignment import bulk_assign_students
 
 
 from dependencies.auth_dep import get_current_user
@@ -145,47 +146,16 @@ async def assign_students_to_batch(data: AssignStudentsRequest, db: AsyncSession
     if not batch:
         raise HTTPException(status_code=404, detail="Batch not found")
 
-    assigned, moved, skipped = [], [], []
-
-    for student_id in data.student_ids:
-
-        # 🔥 Lookup using student_id + course_id to avoid overwriting other course assignments
-        result = await db.execute(
-            select(BatchStudent).where(
-                BatchStudent.student_id == student_id,
-                BatchStudent.course_id == batch.course_id
-            )
-        )
-
-        existing_assignment = result.scalar_one_or_none()
-
-        if existing_assignment:
-            if existing_assignment.batch_id == data.batch_id:
-                skipped.append(student_id)
-            else:
-                existing_assignment.batch_id = data.batch_id
-                existing_assignment.batch_name = batch.batch_name
-                moved.append(student_id)
-
-        else:
-            db.add(
-                BatchStudent(
-                    student_id=student_id,
-                    batch_id=data.batch_id,
-                    course_id=batch.course_id,   # 🔥 required
-                    batch_name=batch.batch_name
-                )
-            )
-            assigned.append(student_id)
-
+    # 🔥 Scoped to the batch's course so other course assignments are untouched
+    report = await bulk_assign_students(db, batch, data.student_ids)
     await db.commit()
 
     return {
         "status": "success",
         "batch": batch.batch_name,
-        "new_assigned": assigned,
-        "moved": moved,
-        "already_in_same_batch": skipped
+        "new_assigned": report.assigned,
+        "moved": report.moved,
+        "already_in_same_batch": report.skipped
     }
 
 
@@ -204,46 +174,14 @@ async def update_student_batch(
     if not batch:
         raise HTTPException(status_code=404, detail="Batch not found")
 
-    moved_students = []
-    assigned_new = []
-
-    for student_id in student_ids:
-
-        # Fetch all batch assignments for the student
-        result = await db.execute(
-            select(BatchStudent).where(BatchStudent.student_id == student_id)
-        )
-        assignments = result.scalars().all()
-
-        if not assignments:
-            # Student not assigned anywhere, create a new record
-            db.add(
-                BatchStudent(
-                    student_id=student_id,
-                    batch_id=batch_id,
-                    batch_name=batch.batch_name
-                )
-            )
-            assigned_new.append(student_id)
-        else:
-            # Update the first record to new batch
-            main_assignment = assignments[0]
-            if main_assignment.batch_id != batch_id:
-                main_assignment.batch_id = batch_id
-                main_assignment.batch_name = batch.batch_name
-                moved_students.append(student_id)
-
-            # Delete all duplicate extra rows if any
-            if len(assignments) > 1:
-                for extra in assignments[1:]:
-                    await db.delete(extra)
-
+    # One row per (student, course): upsert into this batch's course
+    report = await bulk_assign_students(db, batch, student_ids)
     await db.commit()
 
     return {
         "status": "success",
         "message": "Batch assignment updated successfully",
         "batch": batch.batch_name,
-        "assigned_new": assigned_new,
-        "moved_students": moved_students
+        "assigned_new": report.assigned,
+        "moved_students": report.moved
     }
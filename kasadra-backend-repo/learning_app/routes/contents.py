@@ -3,7 +3,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from models.course import Course, Lesson, Pdf, WebLink, Quiz, Lab
 from database.db import get_session
-from utils.gcp import upload_file_to_gcs  
+from utils.gcp import upload_file_to_gcs, generate_upload_url, gcs_object_exists, public_url
+from schemas.contents import UploadUrlRequest, PdfUploadConfirm, QuizUploadConfirm, LabUploadConfirm
 
 
 pdf_router = APIRouter(tags=["PDF"])
@@ -543,3 +544,185 @@ async def delete_lab(
     await db.commit()
 
     return {"status": "success", "message": "Lab deleted"}
+
+
+#####################################################################
+############# Direct-to-storage uploads #############
+#####################################################################
+
+# Two-phase flow so file bytes never pass through the API:
+#   1. POST /upload-url/<kind>  -> signed PUT URL + object_name
+#   2. client PUTs the file straight to GCS
+#   3. POST /confirm/<kind>     -> object is checked and the DB row created
+
+PDF_FOLDER = "pdfs"
+QUIZ_FOLDER = "quiz-files"
+LAB_FOLDER = "lab-files"
+
+
+async def verify_course_lesson(db: AsyncSession, course_id: int, lesson_id: int):
+    course = await db.get(Course, course_id)
+    if not course:
+        raise HTTPException(status_code=404, detail="Course not found")
+
+    lesson = await db.get(Lesson, lesson_id)
+    if not lesson:
+        raise HTTPException(status_code=404, detail="Lesson not found")
+
+    if lesson.course_id != course_id:
+        raise HTTPException(
+            status_code=400,
+            detail="The given lesson does not belong to the specified course"
+        )
+
+
+async def verify_uploaded_object(object_name: str, folder: str) -> str:
+    # Only accept objects issued for this content type
+    if not object_name.startswith(f"{folder}/") or ".." in object_name:
+        raise HTTPException(status_code=400, detail="Invalid object name for this upload")
+
+    if not await gcs_object_exists(object_name):
+        raise HTTPException(status_code=409, detail="File has not been uploaded yet")
+
+    return public_url(object_name)
+
+
+############# PDF #############
+
+@pdf_router.post("/upload-url/pdf")
+async def pdf_upload_url(
+    request: UploadUrlRequest,
+    db: AsyncSession = Depends(get_session),
+):
+    await verify_course_lesson(db, request.course_id, request.lesson_id)
+    upload = await generate_upload_url(PDF_FOLDER, request.filename, request.content_type)
+
+    return {"status": "success", "message": "Upload URL created", "data": upload}
+
+
+@pdf_router.post("/confirm/pdf")
+async def confirm_pdf_upload(
+    confirm: PdfUploadConfirm,
+    db: AsyncSession = Depends(get_session),
+):
+    await verify_course_lesson(db, confirm.course_id, confirm.lesson_id)
+    file_url = await verify_uploaded_object(confirm.object_name, PDF_FOLDER)
+
+    pdf_entry = Pdf(
+        course_id=confirm.course_id,
+        lesson_id=confirm.lesson_id,
+        file_url=file_url,
+    )
+
+    db.add(pdf_entry)
+    await db.commit()
+    await db.refresh(pdf_entry)
+
+    return {
+        "status": "success",
+        "message": "PDF uploaded successfully",
+        "data": {
+            "pdf_id": pdf_entry.id,
+            "file_url": file_url,
+        },
+    }
+
+
+############# Quiz #############
+
+@quiz_router.post("/upload-url/quiz")
+async def quiz_upload_url(
+    request: UploadUrlRequest,
+    db: AsyncSession = Depends(get_session),
+):
+    await verify_course_lesson(db, request.course_id, request.lesson_id)
+    upload = await generate_upload_url(QUIZ_FOLDER, request.filename, request.content_type)
+
+    return {"status": "success", "message": "Upload URL created", "data": upload}
+
+
+@quiz_router.post("/confirm/quiz")
+async def confirm_quiz_upload(
+    confirm: QuizUploadConfirm,
+    db: AsyncSession = Depends(get_session),
+):
+    await verify_course_lesson(db, confirm.course_id, confirm.lesson_id)
+
+    file_url = None
+    if confirm.object_name:
+        file_url = await verify_uploaded_object(confirm.object_name, QUIZ_FOLDER)
+
+    quiz_entry = Quiz(
+        course_id=confirm.course_id,
+        lesson_id=confirm.lesson_id,
+        name=confirm.name,
+        description=confirm.description,
+        url=confirm.url,
+        file_url=file_url,
+    )
+
+    db.add(quiz_entry)
+    await db.commit()
+    await db.refresh(quiz_entry)
+
+    return {
+        "status": "success",
+        "message": "Quiz added successfully",
+        "data": {
+            "quiz_id": quiz_entry.id,
+            "name": quiz_entry.name,
+            "description": quiz_entry.description,
+            "url": quiz_entry.url,
+            "file_url": file_url,
+        },
+    }
+
+
+############# Lab #############
+
+@lab_router.post("/upload-url/lab")
+async def lab_upload_url(
+    request: UploadUrlRequest,
+    db: AsyncSession = Depends(get_session),
+):
+    await verify_course_lesson(db, request.course_id, request.lesson_id)
+    upload = await generate_upload_url(LAB_FOLDER, request.filename, request.content_type)
+
+    return {"status": "success", "message": "Upload URL created", "data": upload}
+
+
+@lab_router.post("/confirm/lab")
+async def confirm_lab_upload(
+    confirm: LabUploadConfirm,
+    db: AsyncSession = Depends(get_session),
+):
+    await verify_course_lesson(db, confirm.course_id, confirm.lesson_id)
+
+    file_url = None
+    if confirm.object_name:
+        file_url = await verify_uploaded_object(confirm.object_name, LAB_FOLDER)
+
+    lab_entry = Lab(
+        course_id=confirm.course_id,
+        lesson_id=confirm.lesson_id,
+        name=confirm.name,
+        description=confirm.description,
+        url=confirm.url,
+        file_url=file_url,
+    )
+
+    db.add(lab_entry)
+    await db.commit()
+    await db.refresh(lab_entry)
+
+    return {
+        "status": "success",
+        "message": "Lab added successfully",
+        "data": {
+            "lab_id": lab_entry.id,
+            "name": lab_entry.name,
+            "description": lab_entry.description,
+            "url": lab_entry.url,
+            "file_url": file_url,
+        },
+    }
@@ -13,6 +13,8 @@ from sqlalchemy.orm import joinedload
 from sqlalchemy import func
 from models.purchased_courses import PurchasedCourse
 from schemas.course import NoteCreate
+from services.course_catalog import load_course_page, InvalidCursor
+from services.catalog_cache import catalog_cache, CATALOG, course_tag, course_lessons_tag
 
 
 router = APIRouter()
@@ -66,6 +68,7 @@ async def add_course(
     db.add(new_course)
     await db.commit()
     await db.refresh(new_course, attribute_names=["instructor"])
+    await catalog_cache.invalidate(CATALOG)
 
     # Return course info with S3 URL
     return {
@@ -80,39 +83,27 @@ async def add_course(
 ######################## Get all courses ########################
 
 @router.get("/all", tags=["courses"])
-async def get_all_courses(db: AsyncSession = Depends(get_session)):
-    # Step 1: Get all courses with instructor data
-    result = await db.execute(
-        select(Course).options(joinedload(Course.instructor))
-    )
-    courses = result.scalars().all()
-
-    # Step 2: Get enrollment count for each course
-    enroll_result = await db.execute(
-        select(
-            PurchasedCourse.course_id,
-            func.count(PurchasedCourse.id).label("enrollments")
-        ).group_by(PurchasedCourse.course_id)
-    )
-    enrollments_data = {row.course_id: row.enrollments for row in enroll_result.all()}
+async def get_all_courses(
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+    instructor_id: Optional[int] = None,
+    q: Optional[str] = None,
+    db: AsyncSession = Depends(get_session)
+):
+    # Keyset pages ordered by course id; pass page.next_cursor back as `cursor`
+    try:
+        page = await catalog_cache.get_or_load(
+            f"courses:{cursor}:{limit}:{instructor_id}:{q}",
+            [CATALOG],
+            lambda: load_course_page(db, cursor=cursor, limit=limit, instructor_id=instructor_id, search=q),
+        )
+    except InvalidCursor:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
-    # Step 3: Combine both datasets
     return {
         "status": "success",
-        "data": [
-            {
-                "id": course.id,
-                "instructor_id": course.instructor_id,
-                "instructor_name": course.instructor.name if course.instructor else None,
-                "title": course.title,
-                "description": course.description,
-                "duration": course.duration,
-                "thumbnail": course.thumbnail_url,
-                "created_at": course.created_at,
-                "total_enrollments": enrollments_data.get(course.id, 0)  # ✅ Added here
-            }
-            for course in courses
-        ]
+        "data": page["data"],
+        "page": page["page"]
     }
 
 ################## Get course by ID ####################
@@ -120,6 +111,20 @@ async def get_all_courses(db: AsyncSession = Depends(get_session)):
 
 @router.get("/{course_id}", tags=["courses"])
 async def get_course_by_id(course_id: int, db: AsyncSession = Depends(get_session)):
+    course = await catalog_cache.get_or_load(
+        f"course:{course_id}", [course_tag(course_id)], lambda: load_course(db, course_id)
+    )
+
+    if not course:
+        raise HTTPException(status_code=404, detail="Course not found")
+
+    return {
+        "status": "success",
+        "data": course
+    }
+
+
+async def load_course(db: AsyncSession, course_id: int):
     # Query course with instructor join
     result = await db.execute(
         select(
@@ -136,23 +141,18 @@ async def get_course_by_id(course_id: int, db: AsyncSession = Depends(get_sessio
         .where(Course.id == course_id)
     )
     course = result.first()
-
     if not course:
-        raise HTTPException(status_code=404, detail="Course not found")
+        return None
 
     return {
-        "status": "success",
-        "data": {
-                "id": course.id,
-                "instructor_id": course.instructor_id,
-                "instructor_name": course.instructor_name,
-                "title": course.title,
-                "description": course.description,
-                "duration": course.duration,
-                "thumbnail": course.thumbnail_url,
-                "created_at": course.created_at,
-           
-        }
+        "id": course.id,
+        "instructor_id": course.instructor_id,
+        "instructor_name": course.instructor_name,
+        "title": course.title,
+        "description": course.description,
+        "duration": course.duration,
+        "thumbnail": course.thumbnail_url,
+        "created_at": course.created_at,
     }
 
 ########### Delete course by ID ##############
@@ -171,6 +171,7 @@ async def delete_course(
     # Delete the course
     await db.delete(course)
     await db.commit()
+    await catalog_cache.invalidate(CATALOG, course_tag(course_id), course_lessons_tag(course_id))
 
     # Return minimal success response
     return {
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, Field, EmailStr, field_validator, model_validator
 from sqlalchemy.orm import Session
-from utils.passwd import hash_password, verify_password
+from utils.passwd import hash_password_async, verify_password_async
 import re
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
@@ -66,7 +66,7 @@ async def create_instructor(instructor: InstructorCreate, db: Session = Depends(
             name=instructor.Name,
             email=instructor.Email,
             phone_no=instructor.PhoneNo,
-            password=hash_password(instructor.Password),
+            password=await hash_password_async(instructor.Password),
             role=RoleEnum.instructor
         )
 
@@ -212,7 +212,7 @@ async def instructor_login(
             )
 
         # Validate password
-        if not verify_password(request.Password, instructor.password):
+        if not await verify_password_async(request.Password, instructor.password):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail={"status": "error", "message": "Incorrect password", "data": {}}
@@ -8,6 +8,8 @@ from datetime import datetime
 from typing import Optional
 from dependencies.auth_dep import get_current_user
 from utils.gcp import upload_file_to_gcs 
+from services.lesson_content import load_lesson_bundle
+from services.catalog_cache import catalog_cache, course_tag, course_lessons_tag
 from pydantic import BaseModel
 from typing import Optional, Union
 from sqlalchemy.orm import selectinload
@@ -64,6 +66,7 @@ async def add_lesson(
     db.add(new_lesson)
     await db.commit()
     await db.refresh(new_lesson)
+    await catalog_cache.invalidate(course_lessons_tag(course.id))
 
     return {
         "status": "success",
@@ -85,9 +88,8 @@ async def get_lesson_by_id(
     lesson_id: int,
     db: AsyncSession = Depends(get_session)
 ):
-    # Fetch lesson
-    result = await db.execute(select(Lesson).where(Lesson.id == lesson_id))
-    lesson = result.scalar_one_or_none()
+    # Fetch lesson with pdfs, weblinks, quizzes, labs and notes in one query
+    lesson = await load_lesson_bundle(db, lesson_id)
 
     if not lesson:
         raise HTTPException(
@@ -95,90 +97,9 @@ async def get_lesson_by_id(
             detail="Lesson not found"
         )
 
-    # Fetch PDFs
-    pdfs_result = await db.execute(
-        select(Pdf).where(Pdf.lesson_id == lesson_id)
-    )
-    pdfs = pdfs_result.scalars().all()
-
-    # Fetch WebLinks
-    weblinks_result = await db.execute(
-        select(WebLink).where(WebLink.lesson_id == lesson_id)
-    )
-    weblinks = weblinks_result.scalars().all()
-
-    # Fetch Quizzes
-    quizzes_result = await db.execute(
-        select(Quiz).where(Quiz.lesson_id == lesson_id)
-    )
-    quizzes = quizzes_result.scalars().all()
-
-    # Fetch Labs
-    labs_result = await db.execute(
-        select(Lab).where(Lab.lesson_id == lesson_id)
-    )
-    labs = labs_result.scalars().all()
-    
-    notes_result = await db.execute(
-    select(Note).where(Note.lesson_id == lesson_id)
-    )
-    notes = notes_result.scalars().all()
     return {
         "status": "success",
-        "data": {
-            "lesson_id": lesson.id,
-            "course_id": lesson.course_id,
-            "instructor_id": lesson.instructor_id,
-            "title": lesson.lesson_title,
-            "description": lesson.description,
-            "created_at": lesson.created_at,
-
-            # Add all related content
-            "pdfs": [
-                {
-                    "id": pdf.id,
-                    "file_url": pdf.file_url
-                }
-                for pdf in pdfs
-            ],
-            "weblinks": [
-                {
-                    "id": link.id,
-                    "url": link.link_url
-                }
-                for link in weblinks
-            ],
-            "quizzes": [
-                {
-                    "id": quiz.id,
-                    "name": quiz.name,
-                    "description": quiz.description,
-                    "url": quiz.url,
-                    "file_url": quiz.file_url
-                }
-                for quiz in quizzes
-            ],
-            "labs": [
-                {
-                    "id": lab.id,
-                    "name": lab.name,
-                    "description": lab.description,
-                    "url": lab.url,
-                    "file_url": lab.file_url
-                }
-                for lab in labs
-            ],
-            "notes": [
-                {
-                    "id": n.id,
-                    "course_id": n.course_id,
-                    "lesson_id": n.lesson_id,
-                    "instructor_id": n.instructor_id,
-                    "notes": n.notes
-                }
-                for n in notes
-            ]  # Placeholder for notes if needed in future
-        },
+        "data": lesson,
     }
 ###################### Get lessons by course_id #####################
 
@@ -187,10 +108,11 @@ async def get_lessons_by_course_id(
     course_id: int,
     db: AsyncSession = Depends(get_session)
 ):
-    result = await db.execute(
-        select(Lesson).where(Lesson.course_id == course_id).options(selectinload(Lesson.course))
+    lessons = await catalog_cache.get_or_load(
+        f"lessons:{course_id}",
+        [course_tag(course_id), course_lessons_tag(course_id)],
+        lambda: load_course_lessons(db, course_id),
     )
-    lessons = result.scalars().all()
 
     if not lessons:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No lessons found for this course")
@@ -198,17 +120,28 @@ async def get_lessons_by_course_id(
     return {
         "status": "success",
         "course_id": course_id,
-        "lessons": [
-            {
-                "lesson_id": l.id,
-                "title": l.lesson_title,
-                "course_title": l.course.title,
-                "description": l.description,
-                "created_at": l.created_at,
-            } for l in lessons
-        ]
+        "lessons": lessons
     }
 
+
+async def load_course_lessons(db: AsyncSession, course_id: int):
+    result = await db.execute(
+        select(Lesson).where(Lesson.course_id == course_id).options(selectinload(Lesson.course))
+    )
+    lessons = result.scalars().all()
+    if not lessons:
+        return None
+
+    return [
+        {
+            "lesson_id": l.id,
+            "title": l.lesson_title,
+            "course_title": l.course.title,
+            "description": l.description,
+            "created_at": l.created_at,
+        } for l in lessons
+    ]
+
 ######################## Update lesson #######################
 
 @router.put("/{lesson_id}")
@@ -233,6 +166,7 @@ async def update_lesson(
     db.add(lesson)
     await db.commit()
     await db.refresh(lesson)
+    await catalog_cache.invalidate(course_lessons_tag(lesson.course_id))
 
     return {
         "status": "success",
@@ -254,7 +188,9 @@ async def delete_lesson(lesson_id: int, db: AsyncSession = Depends(get_session))
     if not lesson:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Lesson not found")
 
+    course_id = lesson.course_id
     await db.delete(lesson)
     await db.commit()
+    await catalog_cache.invalidate(course_lessons_tag(course_id))
 
     return {"status": "success", "message": "Lesson deleted successfully"}
\ No newline at end of file
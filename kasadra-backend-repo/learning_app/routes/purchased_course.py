@@ -7,6 +7,8 @@ from models.add_to_cart import Cart
 from models.course import User, Course
 from models.course import Batch, BatchStudent
 from database.db import get_session
+from services.enrollment_counts import increment_enrollments, load_enrollment_counts
+from services.catalog_cache import catalog_cache, CATALOG, student_tag
 
 
 router = APIRouter()
@@ -37,8 +39,14 @@ async def buy_course(
     purchased = PurchasedCourse(student_id=student_id, course_id=course_id)
     db.add(purchased)
 
+    # Step 4: Bump the course's enrollment counter in the same transaction
+    await increment_enrollments(db, course_id)
+
     await db.commit()
 
+    # Step 5: Enrollment counts and this student's recommendations changed
+    await catalog_cache.invalidate(CATALOG, student_tag(student_id))
+
     return {"status": "success", "message": "Course purchased successfully"}
 
 
@@ -71,6 +79,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 @router.get("/all/{student_id}", tags=["recommended-ak"])
 async def get_courses(student_id: int, db: AsyncSession = Depends(get_session)):
+    return await catalog_cache.get_or_load(
+        f"recommended:{student_id}",
+        [CATALOG, student_tag(student_id)],
+        lambda: load_recommended_courses(db, student_id),
+    )
+
+
+async def load_recommended_courses(db: AsyncSession, student_id: int):
     # Step 1: Get all purchased course IDs for this student
     result = await db.execute(
         select(PurchasedCourse.course_id).where(PurchasedCourse.student_id == student_id)
@@ -88,14 +104,8 @@ async def get_courses(student_id: int, db: AsyncSession = Depends(get_session)):
     result = await db.execute(query)
     courses = result.scalars().all()
 
-    # Step 5: Get enrollment count for each course
-    enroll_result = await db.execute(
-        select(
-            PurchasedCourse.course_id,
-            func.count(PurchasedCourse.id).label("enrollments")
-        ).group_by(PurchasedCourse.course_id)
-    )
-    enrollments_data = {row.course_id: row.enrollments for row in enroll_result.all()}
+    # Step 5: Get enrollment count for the listed courses
+    enrollments_data = await load_enrollment_counts(db, [course.id for course in courses])
 
     # Step 6: Build response
     data = [
@@ -149,14 +159,10 @@ async def get_all_courses_for_student(student_id: int, db: AsyncSession = Depend
     recommended_result = await db.execute(recommended_query)
     recommended_courses = recommended_result.scalars().all()
 
-    # Step 5: Get enrollment counts for all courses
-    enroll_result = await db.execute(
-        select(
-            PurchasedCourse.course_id,
-            func.count(PurchasedCourse.id).label("enrollments")
-        ).group_by(PurchasedCourse.course_id)
+    # Step 5: Get enrollment counts for the listed courses
+    enrollments_data = await load_enrollment_counts(
+        db, [c.id for c in purchased_courses] + [c.id for c in recommended_courses]
     )
-    enrollments_data = {row.course_id: row.enrollments for row in enroll_result.all()}
 
     # Step 6: Format data
     def serialize_course(course):
@@ -6,6 +6,7 @@ from database.db import get_session
 from datetime import date, datetime
 from pydantic import BaseModel
 from typing import Optional
+from services.calendar import load_course_calendar, load_batch_calendar
 
 router = APIRouter(tags=["calendar"])
 
@@ -109,29 +110,26 @@ async def get_course_calendar(course_id: int, db: AsyncSession = Depends(get_ses
     if not course:
         raise HTTPException(404, f"Course ID {course_id} not found")
 
-    # Fetch calendar entries
-    calendars = (await db.execute(
-        select(CourseCalendar).where(CourseCalendar.course_id == course_id)
-    )).scalars().all()
+    # Fetch calendar entries with batch name and lesson title in one query
+    calendars = await load_course_calendar(db, course_id)
 
     if not calendars:
         return {"status": "success", "message": "No schedule class entries found", "data": []}
 
     # Build result
-    data = []
-    for c in calendars:
-        batch = await db.get(Batch, c.batch_id)
-        lesson = await db.get(Lesson, c.lesson_id)
-        data.append({
-            "calendar_id": c.id,
+    data = [
+        {
+            "calendar_id": c.calendar_id,
             "course_id": c.course_id,
-            "batch_name": batch.batch_name if batch else None,
-            "lesson_title": lesson.lesson_title if lesson else None,
+            "batch_name": c.batch_name,
+            "lesson_title": c.lesson_title,
             "select_date": str(c.select_date),
             "day": c.day,
             "start_time": str(c.start_time),
             "end_time": str(c.end_time),
-        })
+        }
+        for c in calendars
+    ]
 
     return {"status": "success", "data": data}
 
@@ -240,48 +238,43 @@ async def get_student_calendar(student_id: int, course_id: int, db: AsyncSession
     if student.role != RoleEnum.student:
         raise HTTPException(403, "User is not a student")
 
-    # 2. Find batch for this student
+    # 2. Find this student's batch mappings (with batch) in one query
     result = await db.execute(
-        select(BatchStudent).where(BatchStudent.student_id == student_id)
+        select(BatchStudent, Batch)
+        .join(Batch, Batch.id == BatchStudent.batch_id)
+        .where(BatchStudent.student_id == student_id)
     )
-    mapping = result.scalar_one_or_none()
+    mappings = result.all()
 
-    if not mapping:
+    if not mappings:
         raise HTTPException(404, "Student is not assigned to any batch")
 
-    batch = await db.get(Batch, mapping.batch_id)
-
+    # 3. Pick the batch that belongs to this course
+    batch = next((b for _, b in mappings if b.course_id == course_id), None)
     if not batch:
-        raise HTTPException(404, "Batch not found")
-
-    # 3. Check batch belongs to same course
-    if batch.course_id != course_id:
         raise HTTPException(400, "Student is not enrolled in this course")
 
     # 4. Fetch calendar entries for this student's batch
-    calendar_entries = (await db.execute(
-        select(CourseCalendar).where(CourseCalendar.batch_id == batch.id)
-    )).scalars().all()
+    calendar_entries = await load_batch_calendar(db, batch.id)
 
     if not calendar_entries:
         return {"status": "success", "message": "No scheduled classes", "data": []}
 
     # 5. Build response
-    data = []
-    for c in calendar_entries:
-        lesson = await db.get(Lesson, c.lesson_id)
-
-        data.append({
-            "calendar_id": c.id,
+    data = [
+        {
+            "calendar_id": c.calendar_id,
             "course_id": c.course_id,
             "batch_id": c.batch_id,
             "batch_name": batch.batch_name,
-            "lesson_title": lesson.lesson_title if lesson else None,
+            "lesson_title": c.lesson_title,
             "select_date": str(c.select_date),
             "day": c.day,
             "start_time": str(c.start_time),
             "end_time": str(c.end_time)
-        })
+        }
+        for c in calendar_entries
+    ]
 
     return {
         "status": "success",
@@ -3,14 +3,13 @@ from pydantic import BaseModel, Field, EmailStr, field_validator, model_validato
 from sqlalchemy.orm import Session
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from utils.passwd import hash_password, verify_password
+from utils.passwd import hash_password_async, verify_password_async
 from models.user import User, RoleEnum
 from database.db import get_session
 from common import get_user_by_email
 from utils.auth import create_access_token
 from datetime import timedelta
-from dependencies.auth_dep import get_current_user
-from utils.passwd import hash_password, verify_password
+from dependencies.auth_dep import get_current_user, invalidate_principal
 from passlib.context import CryptContext    
 
 from sqlalchemy.ext.asyncio import AsyncSession as Session
@@ -80,7 +79,7 @@ async def create_student(student: StudentCreate, db: Session = Depends(get_sessi
             )
 
         # Hash password safely
-        hashed_password = hash_password(student.Password)
+        hashed_password = await hash_password_async(student.Password)
 
         # Create new student
         new_student = User(
@@ -324,6 +323,7 @@ async def update_student(
         db.add(student)
         await db.commit()
         await db.refresh(student)
+        invalidate_principal(student.id)
 
         return {
             "detail": {
@@ -379,7 +379,7 @@ async def student_login(request: LoginRequestDetails, db: Session = Depends(get_
                 detail={"status": "error", "message": "Enter valid  Email.", "data": {}}
             )
 
-        if not verify_password(request.Password, student.password):
+        if not await verify_password_async(request.Password, student.password):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail={"status": "error", "message": "Incorrect password.", "data": {}}
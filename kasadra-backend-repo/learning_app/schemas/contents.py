@@ -0,0 +1,34 @@
+from pydantic import BaseModel
+from typing import Optional
+
+
+#####################
+## Direct uploads
+#####################
+
+class UploadUrlRequest(BaseModel):
+    course_id: int
+    lesson_id: int
+    filename: str
+    content_type: str = "application/octet-stream"
+
+class PdfUploadConfirm(BaseModel):
+    course_id: int
+    lesson_id: int
+    object_name: str
+
+class QuizUploadConfirm(BaseModel):
+    course_id: int
+    lesson_id: int
+    name: str
+    description: Optional[str] = None
+    url: Optional[str] = None
+    object_name: Optional[str] = None
+
+class LabUploadConfirm(BaseModel):
+    course_id: int
+    lesson_id: int
+    name: str
+    description: Optional[str] = None
+    url: Optional[str] = None
+    object_name: Optional[str] = None
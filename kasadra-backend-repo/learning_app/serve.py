@@ -0,0 +1,128 @@
+#####################################################################
+## Production launcher
+#####################################################################
+
+# Runs the app on several uvicorn worker processes behind uvicorn's own
+# supervisor, which restarts any worker that exits. Usage:
+#
+#     python serve.py
+#
+# Environment:
+#   HOST / PORT                  bind address (0.0.0.0:8000)
+#   WEB_CONCURRENCY              worker processes (default: CPU count)
+#   WEB_LOOP                     auto | uvloop | asyncio
+#   WEB_HTTP                     auto | httptools | h11
+#   WEB_MAX_REQUESTS             recycle a worker after this many requests (0 = never)
+#   WEB_MAX_REQUESTS_JITTER      random extra requests so workers don't recycle together
+#   WEB_GRACEFUL_TIMEOUT         seconds in-flight requests get to finish on shutdown
+#   WEB_KEEPALIVE                keep-alive timeout in seconds
+#
+# The schema is not touched here: run `python -m database.migrate` first (the
+# deployment does it in an init container). The launcher checks the schema
+# version once before starting workers so an unmigrated database fails fast
+# instead of crash-looping every worker. Each worker has its own DB pool, so
+# the database sees up to WEB_CONCURRENCY * (DB_POOL_SIZE + DB_MAX_OVERFLOW)
+# connections per pod.
+
+import asyncio
+import importlib.util
+import logging
+import os
+import sys
+from dataclasses import dataclass
+
+import uvicorn
+from uvicorn.supervisors import Multiprocess
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+logger = logging.getLogger("kasadra.serve")
+
+
+@dataclass
+class ServeSettings:
+    host: str
+    port: int
+    workers: int
+    loop: str
+    http: str
+    max_requests: int
+    max_requests_jitter: int
+    graceful_timeout: int
+    keepalive: int
+
+
+def _installed(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def resolve_loop(choice: str) -> str:
+    if choice == "auto":
+        return "uvloop" if _installed("uvloop") and sys.platform != "win32" else "asyncio"
+    return choice
+
+
+def resolve_http(choice: str) -> str:
+    if choice == "auto":
+        return "httptools" if _installed("httptools") else "h11"
+    return choice
+
+
+def load_settings(env=os.environ) -> ServeSettings:
+    return ServeSettings(
+        host=env.get("HOST") or "0.0.0.0",
+        port=int(env.get("PORT") or 8000),
+        workers=max(1, int(env.get("WEB_CONCURRENCY") or os.cpu_count() or 1)),
+        loop=resolve_loop(env.get("WEB_LOOP") or "auto"),
+        http=resolve_http(env.get("WEB_HTTP") or "auto"),
+        max_requests=int(env.get("WEB_MAX_REQUESTS") or 10000),
+        max_requests_jitter=int(env.get("WEB_MAX_REQUESTS_JITTER") or 1000),
+        graceful_timeout=int(env.get("WEB_GRACEFUL_TIMEOUT") or 30),
+        keepalive=int(env.get("WEB_KEEPALIVE") or 5),
+    )
+
+
+def uvicorn_config(settings: ServeSettings) -> uvicorn.Config:
+    return uvicorn.Config(
+        "main:app",
+        host=settings.host,
+        port=settings.port,
+        workers=settings.workers,
+        loop=settings.loop,
+        http=settings.http,
+        limit_max_requests=settings.max_requests or None,
+        limit_max_requests_jitter=settings.max_requests_jitter if settings.max_requests else 0,
+        timeout_graceful_shutdown=settings.graceful_timeout,
+        timeout_keep_alive=settings.keepalive,
+        proxy_headers=True,
+    )
+
+
+def check_schema_once():
+    from database.db import check_schema
+    from database.dbconfig import engine
+
+    async def _check():
+        try:
+            return await check_schema()
+        finally:
+            await engine.dispose()  # don't hand pooled connections to the workers
+    logger.info("database schema at version %s", asyncio.run(_check()))
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+    settings = load_settings()
+    logger.info("starting %s", settings)
+
+    check_schema_once()
+
+    config = uvicorn_config(settings)
+    sock = config.bind_socket()
+    # Always go through the supervisor, even with one worker, so a worker
+    # recycled after WEB_MAX_REQUESTS is replaced instead of ending the pod.
+    Multiprocess(config, sockets=[sock]).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#####################################################################
+## Set-based batch assignment
+#####################################################################
+
+# Assigning a cohort to a batch is one SELECT for the students already
+# placed in the batch's course plus one INSERT ... ON CONFLICT for everyone
+# who needs a row written, regardless of cohort size. The unique
+# (student_id, course_id) constraint is what makes the upsert safe when two
+# requests race on the same student. Student ids travel as a single array
+# parameter, so the statements stay the same size (and under asyncpg's
+# bind-parameter limit) for any cohort.
+
+from dataclasses import dataclass, field
+from typing import Iterable, List
+
+from sqlalchemy import Integer, String, any_, bindparam, func, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.course import Batch, BatchStudent
+
+
+@dataclass
+class AssignmentReport:
+    assigned: List[int] = field(default_factory=list)
+    moved: List[int] = field(default_factory=list)
+    skipped: List[int] = field(default_factory=list)
+
+
+def _unique(student_ids: Iterable[int]) -> List[int]:
+    # keep request order so the report lists students the way they were sent
+    return list(dict.fromkeys(student_ids))
+
+
+async def bulk_assign_students(db: AsyncSession, batch: Batch, student_ids: Iterable[int]) -> AssignmentReport:
+    """Place every student in `batch`, moving them out of any other batch of
+    the same course. Does not commit."""
+    student_ids = _unique(student_ids)
+    report = AssignmentReport()
+    if not student_ids:
+        return report
+
+    # 1. current placement of these students within the batch's course
+    result = await db.execute(
+        select(BatchStudent.student_id, BatchStudent.batch_id).where(
+            BatchStudent.course_id == batch.course_id,
+            BatchStudent.student_id == any_(bindparam("student_ids", student_ids, type_=ARRAY(Integer))),
+        )
+    )
+    current = dict(result.all())
+
+    # 2. classify
+    for student_id in student_ids:
+        if student_id not in current:
+            report.assigned.append(student_id)
+        elif current[student_id] == batch.id:
+            report.skipped.append(student_id)
+        else:
+            report.moved.append(student_id)
+
+    changed = sorted(report.assigned + report.moved)
+    if not changed:
+        return report
+
+    # 3. one upsert; sorted ids keep row lock order stable between requests
+    rows = select(
+        func.unnest(bindparam("changed_ids", changed, type_=ARRAY(Integer))),
+        literal(batch.id, Integer),
+        literal(batch.course_id, Integer),
+        literal(batch.batch_name, String),
+    )
+    stmt = insert(BatchStudent).from_select(
+        ["student_id", "batch_id", "course_id", "batch_name"], rows
+    )
+    stmt = stmt.on_conflict_do_update(
+        constraint="unique_student_course_assignment",
+        set_={
+            "batch_id": stmt.excluded.batch_id,
+            "batch_name": stmt.excluded.batch_name,
+        },
+    )
+    await db.execute(stmt)
+    return report
@@ -0,0 +1,66 @@
+#####################################################################
+## Calendar read-model
+#####################################################################
+
+# Scheduled classes joined with their batch and lesson in one query, so the
+# calendar views (and anything else that renders a schedule, e.g. an iCal
+# export) never look up batches or lessons row by row.
+
+from dataclasses import dataclass, asdict
+from datetime import date
+from typing import List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.course import CourseCalendar, Batch, Lesson
+
+
+@dataclass
+class CalendarEntry:
+    calendar_id: int
+    course_id: Optional[int]
+    batch_id: Optional[int]
+    batch_name: Optional[str]
+    lesson_id: Optional[int]
+    lesson_title: Optional[str]
+    select_date: Optional[date]
+    day: str
+    start_time: Optional[str]
+    end_time: Optional[str]
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def calendar_query():
+    return (
+        select(
+            CourseCalendar.id.label("calendar_id"),
+            CourseCalendar.course_id,
+            CourseCalendar.batch_id,
+            Batch.batch_name,
+            CourseCalendar.lesson_id,
+            Lesson.lesson_title,
+            CourseCalendar.select_date,
+            CourseCalendar.day,
+            CourseCalendar.start_time,
+            CourseCalendar.end_time,
+        )
+        .outerjoin(Batch, Batch.id == CourseCalendar.batch_id)
+        .outerjoin(Lesson, Lesson.id == CourseCalendar.lesson_id)
+        .order_by(CourseCalendar.select_date, CourseCalendar.start_time, CourseCalendar.id)
+    )
+
+
+async def _load(db: AsyncSession, stmt) -> List[CalendarEntry]:
+    result = await db.execute(stmt)
+    return [CalendarEntry(**row._mapping) for row in result.all()]
+
+
+async def load_course_calendar(db: AsyncSession, course_id: int) -> List[CalendarEntry]:
+    return await _load(db, calendar_query().where(CourseCalendar.course_id == course_id))
+
+
+async def load_batch_calendar(db: AsyncSession, batch_id: int) -> List[CalendarEntry]:
+    return await _load(db, calendar_query().where(CourseCalendar.batch_id == batch_id))
@@ -0,0 +1,47 @@
+#####################################################################
+## Catalogue read cache
+#####################################################################
+
+# Cached reads and the tags they are filed under:
+#
+#   GET /courses/all (every page / filter)  -> CATALOG
+#   GET /courses/{course_id}                -> course:{id}
+#   GET /buy/all/{student_id}               -> CATALOG, student:{id}
+#   GET /lessons/all/{course_id}            -> course:{id}, course-lessons:{id}
+#
+# Writers invalidate the tags they affect after committing (see the
+# routes). With the default in-process backend each worker has its own
+# cache, so other workers may serve a page up to CATALOG_CACHE_TTL_SECONDS
+# old after a write; set CATALOG_CACHE_URL (redis://...) to share entries
+# and invalidations between workers.
+
+import os
+
+from utils.cache import InProcessBackend, ReadCache, SharedBackend
+
+CATALOG_CACHE_TTL_SECONDS = float(os.getenv("CATALOG_CACHE_TTL_SECONDS") or 30)
+CATALOG_CACHE_MAX_ENTRIES = int(os.getenv("CATALOG_CACHE_MAX_ENTRIES") or 2000)
+CATALOG_CACHE_URL = os.getenv("CATALOG_CACHE_URL") or None
+
+CATALOG = "catalog"
+
+
+def course_tag(course_id: int) -> str:
+    return f"course:{course_id}"
+
+
+def course_lessons_tag(course_id: int) -> str:
+    return f"course-lessons:{course_id}"
+
+
+def student_tag(student_id: int) -> str:
+    return f"student:{student_id}"
+
+
+def _default_backend():
+    if CATALOG_CACHE_URL:
+        return SharedBackend(url=CATALOG_CACHE_URL)
+    return InProcessBackend("catalog", CATALOG_CACHE_TTL_SECONDS, CATALOG_CACHE_MAX_ENTRIES)
+
+
+catalog_cache = ReadCache("catalog", CATALOG_CACHE_TTL_SECONDS, _default_backend())
@@ -0,0 +1,120 @@
+#####################################################################
+## Course catalogue pages
+#####################################################################
+
+# GET /courses/all is paged by keyset on Course.id: each page asks for
+# "id > last id seen", so page N costs the same as page 1 and rows inserted
+# meanwhile never shift or duplicate results the way OFFSET does. The
+# cursor handed to clients is opaque (base64 JSON), so the sort key can
+# change later without breaking them. Enrollment counts come from the
+# maintained course_enrollment_counts table (services/enrollment_counts.py).
+
+import base64
+import binascii
+import json
+import os
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.course import Course
+from models.purchased_courses import CourseEnrollmentCount
+from models.user import User
+from services.enrollment_counts import enrollment_count_column
+
+COURSE_PAGE_DEFAULT = int(os.getenv("COURSE_PAGE_DEFAULT") or 50)
+COURSE_PAGE_MAX = int(os.getenv("COURSE_PAGE_MAX") or 100)
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(course_id: int) -> str:
+    raw = json.dumps({"id": course_id}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        course_id = json.loads(raw)["id"]
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise InvalidCursor(cursor)
+    if not isinstance(course_id, int):
+        raise InvalidCursor(cursor)
+    return course_id
+
+
+def clamp_page_size(limit: Optional[int]) -> int:
+    if limit is None:
+        return COURSE_PAGE_DEFAULT
+    return max(1, min(limit, COURSE_PAGE_MAX))
+
+
+def course_page_query(after_id: Optional[int], limit: int,
+                      instructor_id: Optional[int] = None, search: Optional[str] = None):
+    """One page of courses with instructor name and enrollment count.
+
+    Fetches `limit + 1` rows; the extra row only tells whether a next page exists.
+    """
+    stmt = (
+        select(
+            Course.id,
+            Course.instructor_id,
+            User.name.label("instructor_name"),
+            Course.title,
+            Course.description,
+            Course.duration,
+            Course.thumbnail_url,
+            Course.created_at,
+            enrollment_count_column().label("total_enrollments"),
+        )
+        .outerjoin(User, User.id == Course.instructor_id)
+        .outerjoin(CourseEnrollmentCount, CourseEnrollmentCount.course_id == Course.id)
+        .order_by(Course.id)
+        .limit(limit + 1)
+    )
+    if after_id is not None:
+        stmt = stmt.where(Course.id > after_id)
+    if instructor_id is not None:
+        stmt = stmt.where(Course.instructor_id == instructor_id)
+    if search:
+        stmt = stmt.where(Course.title.icontains(search, autoescape=True))
+    return stmt
+
+
+def serialize_course(row) -> dict:
+    return {
+        "id": row.id,
+        "instructor_id": row.instructor_id,
+        "instructor_name": row.instructor_name,
+        "title": row.title,
+        "description": row.description,
+        "duration": row.duration,
+        "thumbnail": row.thumbnail_url,
+        "created_at": row.created_at,
+        "total_enrollments": row.total_enrollments,
+    }
+
+
+async def load_course_page(db: AsyncSession, cursor: Optional[str] = None, limit: Optional[int] = None,
+                           instructor_id: Optional[int] = None, search: Optional[str] = None) -> dict:
+    """Return {"data": [...], "page": {...}}; raises InvalidCursor for a bad cursor."""
+    limit = clamp_page_size(limit)
+    after_id = decode_cursor(cursor) if cursor else None
+
+    result = await db.execute(course_page_query(after_id, limit, instructor_id, search))
+    rows = result.all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    return {
+        "data": [serialize_course(row) for row in rows],
+        "page": {
+            "limit": limit,
+            "has_more": has_more,
+            "next_cursor": encode_cursor(rows[-1].id) if has_more else None,
+        },
+    }
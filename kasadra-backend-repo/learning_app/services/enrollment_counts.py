@@ -0,0 +1,124 @@
+#####################################################################
+## Materialized enrollment counters
+#####################################################################
+
+# course_enrollment_counts holds one row per course with its number of
+# purchases. buy_course bumps it in the purchase transaction with an atomic
+# upsert, and catalogue endpoints read it instead of running
+# count(...) GROUP BY over purchased_courses on every request.
+#
+# Anything that writes purchased_courses outside buy_course (manual SQL,
+# imports, refunds) makes the counters drift; reconcile_enrollment_counts
+# recomputes them in one statement and only rewrites rows that are wrong.
+# It runs periodically inside the app (ENROLLMENT_RECONCILE_SECONDS, 0 to
+# disable) and on demand:
+#
+#     python -m services.enrollment_counts
+
+import asyncio
+import logging
+import os
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.course import Course
+from models.purchased_courses import PurchasedCourse, CourseEnrollmentCount
+from services.catalog_cache import catalog_cache, CATALOG
+
+logger = logging.getLogger("kasadra.enrollments")
+
+ENROLLMENT_RECONCILE_SECONDS = int(os.getenv("ENROLLMENT_RECONCILE_SECONDS") or 3600)
+
+# pg advisory lock key, so only one worker/process reconciles at a time
+_RECONCILE_LOCK_KEY = 0x656E726F  # "enro"
+
+
+def enrollment_count_column():
+    """Enrollment count of the outer Course row; outer-join CourseEnrollmentCount on course_id."""
+    return func.coalesce(CourseEnrollmentCount.enrollments, 0)
+
+
+async def increment_enrollments(db: AsyncSession, course_id: int, delta: int = 1):
+    """Adjust the counter inside the caller's transaction. Does not commit."""
+    stmt = insert(CourseEnrollmentCount).values(course_id=course_id, enrollments=delta)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[CourseEnrollmentCount.course_id],
+        set_={
+            "enrollments": CourseEnrollmentCount.enrollments + stmt.excluded.enrollments,
+            "updated_at": func.now(),
+        },
+    )
+    await db.execute(stmt)
+
+
+async def load_enrollment_counts(db: AsyncSession, course_ids) -> dict:
+    """{course_id: enrollments} for the given courses (missing courses count 0)."""
+    course_ids = list(course_ids)
+    if not course_ids:
+        return {}
+    result = await db.execute(
+        select(CourseEnrollmentCount.course_id, CourseEnrollmentCount.enrollments)
+        .where(CourseEnrollmentCount.course_id.in_(course_ids))
+    )
+    return dict(result.all())
+
+
+async def reconcile_enrollment_counts(db: AsyncSession) -> int:
+    """Recompute every counter from purchased_courses and commit.
+
+    Returns the number of counters that were missing or wrong, or -1 when
+    another process already holds the reconcile lock.
+    """
+    locked = await db.scalar(select(func.pg_try_advisory_xact_lock(_RECONCILE_LOCK_KEY)))
+    if not locked:
+        await db.rollback()
+        return -1
+
+    actual = (
+        select(Course.id, func.count(PurchasedCourse.id))
+        .outerjoin(PurchasedCourse, PurchasedCourse.course_id == Course.id)
+        .group_by(Course.id)
+    )
+    stmt = insert(CourseEnrollmentCount).from_select(["course_id", "enrollments"], actual)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[CourseEnrollmentCount.course_id],
+        set_={"enrollments": stmt.excluded.enrollments, "updated_at": func.now()},
+        where=CourseEnrollmentCount.enrollments != stmt.excluded.enrollments,
+    ).returning(CourseEnrollmentCount.course_id)
+
+    result = await db.execute(stmt)
+    repaired = len(result.all())
+    await db.commit()
+    if repaired:
+        await catalog_cache.invalidate(CATALOG)
+    return repaired
+
+
+async def run_reconcile_loop(session_factory, interval: float = ENROLLMENT_RECONCILE_SECONDS):
+    """Reconcile now, then every `interval` seconds, until cancelled."""
+    while True:
+        try:
+            async with session_factory() as db:
+                repaired = await reconcile_enrollment_counts(db)
+            if repaired > 0:
+                logger.warning("repaired %d drifted enrollment counters", repaired)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("enrollment counter reconcile failed")
+        await asyncio.sleep(interval)
+
+
+if __name__ == "__main__":
+    from database.db import async_session, load_models
+
+    async def _main():
+        load_models()
+        async with async_session() as db:
+            repaired = await reconcile_enrollment_counts(db)
+        print("reconcile skipped: already running elsewhere" if repaired < 0
+              else f"repaired {repaired} enrollment counters")
+
+    asyncio.run(_main())
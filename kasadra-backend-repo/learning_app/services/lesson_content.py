@@ -0,0 +1,94 @@
+#####################################################################
+## Lesson content bundle loader
+#####################################################################
+
+# A lesson "bundle" is the lesson row plus its pdfs, weblinks, quizzes, labs
+# and notes. Instead of one SELECT per content table, each collection is
+# aggregated into a JSON array by a correlated subquery, so the whole bundle
+# comes back from Postgres in a single round trip.
+
+from typing import Optional
+
+from sqlalchemy import func, literal_column, select
+from sqlalchemy.dialects.postgresql import JSON, aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.course import Lesson, Pdf, WebLink, Quiz, Lab, Note
+
+
+def _content_array(model, fields: dict):
+    """JSON array of `fields` for every `model` row of the outer lesson."""
+    pairs = []
+    for key, column in fields.items():
+        pairs.extend([literal_column(f"'{key}'"), column])
+
+    return (
+        select(
+            func.coalesce(
+                func.json_agg(aggregate_order_by(func.json_build_object(*pairs), model.id)),
+                literal_column("'[]'::json"),
+                type_=JSON,
+            )
+        )
+        .where(model.lesson_id == Lesson.id)
+        .correlate(Lesson)
+        .scalar_subquery()
+    )
+
+
+def lesson_bundle_query():
+    """SELECT for lessons with all of their content, one row per lesson."""
+    return select(
+        Lesson.id,
+        Lesson.course_id,
+        Lesson.instructor_id,
+        Lesson.lesson_title,
+        Lesson.description,
+        Lesson.created_at,
+        _content_array(Pdf, {"id": Pdf.id, "file_url": Pdf.file_url}).label("pdfs"),
+        _content_array(WebLink, {"id": WebLink.id, "url": WebLink.link_url}).label("weblinks"),
+        _content_array(Quiz, {
+            "id": Quiz.id,
+            "name": Quiz.name,
+            "description": Quiz.description,
+            "url": Quiz.url,
+            "file_url": Quiz.file_url,
+        }).label("quizzes"),
+        _content_array(Lab, {
+            "id": Lab.id,
+            "name": Lab.name,
+            "description": Lab.description,
+            "url": Lab.url,
+            "file_url": Lab.file_url,
+        }).label("labs"),
+        _content_array(Note, {
+            "id": Note.id,
+            "course_id": Note.course_id,
+            "lesson_id": Note.lesson_id,
+            "instructor_id": Note.instructor_id,
+            "notes": Note.notes,
+        }).label("notes"),
+    )
+
+
+def serialize_lesson_bundle(row) -> dict:
+    return {
+        "lesson_id": row.id,
+        "course_id": row.course_id,
+        "instructor_id": row.instructor_id,
+        "title": row.lesson_title,
+        "description": row.description,
+        "created_at": row.created_at,
+        "pdfs": row.pdfs,
+        "weblinks": row.weblinks,
+        "quizzes": row.quizzes,
+        "labs": row.labs,
+        "notes": row.notes,
+    }
+
+
+async def load_lesson_bundle(db: AsyncSession, lesson_id: int) -> Optional[dict]:
+    """Return the serialized bundle for one lesson, or None if it does not exist."""
+    result = await db.execute(lesson_bundle_query().where(Lesson.id == lesson_id))
+    row = result.first()
+    return serialize_lesson_bundle(row) if row else None
@@ -0,0 +1,92 @@
+import os
+import sys
+import asyncio
+from contextlib import asynccontextmanager
+
+from config.settings import TEST_DATABASE_URL
+
+# The app builds its engine at import time, so point it at the test database
+# before anything from learning_app is imported.
+os.environ["DATABASE_URL"] = TEST_DATABASE_URL
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import httpx
+from sqlalchemy import event, text
+
+from database.dbconfig import engine
+from database.db import async_session
+
+
+class QueryCounter:
+    """Counts SQL statements sent through the shared engine while active."""
+
+    def __init__(self):
+        self.statements = []
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    @property
+    def count(self):
+        return len(self.statements)
+
+    def __enter__(self):
+        event.listen(engine.sync_engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(engine.sync_engine, "before_cursor_execute", self._on_execute)
+
+
+def run(coro):
+    """Run a coroutine on a fresh loop and release pooled connections after."""
+    async def _wrapped():
+        try:
+            return await coro
+        finally:
+            await engine.dispose()
+    return asyncio.run(_wrapped())
+
+
+async def database_available():
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        return True
+    except Exception:
+        return False
+
+
+async def drop_schema():
+    async with engine.begin() as conn:
+        await conn.execute(text("DROP SCHEMA public CASCADE"))
+        await conn.execute(text("CREATE SCHEMA public"))
+
+
+async def reset_schema():
+    """Empty database built by the real migrations, as a deploy would."""
+    import main  # noqa: F401  (registers every model on Base.metadata)
+    from database.migrate import migrate
+    from services.catalog_cache import catalog_cache, CATALOG_CACHE_MAX_ENTRIES
+    from utils.cache import InProcessBackend
+    await drop_schema()
+    await migrate(engine)
+    # ids restart with the schema, so nothing cached before is valid
+    catalog_cache.set_backend(InProcessBackend("catalog", catalog_cache.ttl, CATALOG_CACHE_MAX_ENTRIES))
+
+
+async def seed(*objects):
+    """Insert ORM objects in one transaction and return them refreshed."""
+    async with async_session() as session:
+        session.add_all(objects)
+        await session.commit()
+    return objects
+
+
+@asynccontextmanager
+async def app_client():
+    """httpx client wired straight to the FastAPI app (no live server)."""
+    from main import app
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver/api") as client:
+        yield client
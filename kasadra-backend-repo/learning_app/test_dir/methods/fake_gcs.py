@@ -0,0 +1,65 @@
+import time
+from urllib.parse import urlparse, unquote
+
+FAKE_GCS_HOST = "http://fake-gcs.local"
+
+
+class FakeBlob:
+    def __init__(self, bucket, name):
+        self.bucket = bucket
+        self.name = name
+        self.chunk_size = None
+        self.content_type = None
+
+    def upload_from_file(self, file_obj, rewind=False, size=None, content_type=None, **kwargs):
+        if rewind:
+            file_obj.seek(0)
+        read_size = self.chunk_size or size or -1
+        chunks = []
+        while True:
+            chunk = file_obj.read(read_size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            self.bucket.client.chunks_uploaded += 1
+            if self.bucket.client.latency:
+                time.sleep(self.bucket.client.latency)  # blocking, like the real client
+            if read_size == -1:
+                break
+        self.content_type = content_type
+        self.bucket.objects[self.name] = b"".join(chunks)
+
+    def exists(self, **kwargs):
+        return self.name in self.bucket.objects
+
+    def generate_signed_url(self, version=None, expiration=None, method="GET", content_type=None, **kwargs):
+        self.bucket.client.signed_urls += 1
+        return f"{FAKE_GCS_HOST}/{self.bucket.name}/{self.name}?X-Goog-Method={method}&X-Goog-Signature=fake"
+
+
+class FakeBucket:
+    def __init__(self, client, name):
+        self.client = client
+        self.name = name
+        self.objects = {}
+
+    def blob(self, name):
+        return FakeBlob(self, name)
+
+
+class FakeStorageClient:
+    """In-memory stand-in for google.cloud.storage.Client."""
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.chunks_uploaded = 0
+        self.signed_urls = 0
+        self._buckets = {}
+
+    def bucket(self, name):
+        return self._buckets.setdefault(name, FakeBucket(self, name))
+
+    def put_signed_url(self, url, data):
+        """What the browser does with a signed PUT URL."""
+        bucket_name, object_name = unquote(urlparse(url).path).lstrip("/").split("/", 1)
+        self.bucket(bucket_name).objects[object_name] = data
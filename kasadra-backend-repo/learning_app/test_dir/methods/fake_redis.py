@@ -0,0 +1,38 @@
+import time
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis.asyncio calls the shared cache uses."""
+
+    def __init__(self):
+        self.data = {}
+        self.calls = 0
+
+    def _live(self, key):
+        entry = self.data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at < time.monotonic():
+            del self.data[key]
+            return None
+        return value
+
+    async def get(self, key):
+        self.calls += 1
+        return self._live(key)
+
+    async def mget(self, keys):
+        self.calls += 1
+        return [self._live(key) for key in keys]
+
+    async def set(self, key, value, ex=None):
+        self.calls += 1
+        self.data[key] = (value.encode() if isinstance(value, str) else value,
+                          time.monotonic() + ex if ex else None)
+
+    async def incr(self, key):
+        self.calls += 1
+        value = int(self._live(key) or 0) + 1
+        self.data[key] = (str(value).encode(), None)
+        return value
@@ -0,0 +1,81 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pytest
+from http import HTTPStatus
+from methods.db_methods import QueryCounter, run, database_available, reset_schema, seed, app_client
+
+from utils.cache import TTLCache
+
+
+# least recently used entry is evicted first
+def test_ttl_cache_lru_eviction():
+    cache = TTLCache("test", ttl=60, max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+# expired entries count as misses
+def test_ttl_cache_expiry():
+    cache = TTLCache("test", ttl=0, max_entries=10)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+    assert cache.stats()["misses"] == 1
+
+
+if not run(database_available()):
+    pytest.skip("test database is not reachable", allow_module_level=True)
+
+from models.user import User, RoleEnum
+from utils.auth import create_access_token
+from dependencies.auth_dep import principal_cache
+
+
+async def seed_users():
+    await reset_schema()
+    principal_cache.clear()
+    instructor = User(name="Auth Instructor", email="auth@kasadra.test", phone_no="9000000004",
+                      password="x", role=RoleEnum.instructor)
+    student = User(name="Auth Student", email="auth-student@kasadra.test", phone_no="9000000005",
+                   password="x", role=RoleEnum.student)
+    await seed(instructor, student)
+    return instructor.id, student.id
+
+
+async def call(method, path, token, **kwargs):
+    async with app_client() as client:
+        with QueryCounter() as counter:
+            response = await client.request(method, path, headers={"Authorization": f"Bearer {token}"}, **kwargs)
+    return response, counter.count
+
+
+# second protected call skips the users lookup
+def test_get_current_user_is_cached():
+    instructor_id, _ = run(seed_users())
+    token = create_access_token(user_id=instructor_id)
+
+    first, first_queries = run(call("GET", "student/all", token))
+    second, second_queries = run(call("GET", "student/all", token))
+
+    assert first.status_code == second.status_code == HTTPStatus.OK
+    assert first_queries == 2
+    assert second_queries == 1
+    assert principal_cache.stats()["hits"] >= 1
+
+# updating a student drops their cached principal
+def test_update_student_invalidates_principal():
+    _, student_id = run(seed_users())
+    token = create_access_token(user_id=student_id)
+
+    response, _ = run(call("GET", f"student/{student_id}", token))
+    assert response.status_code == HTTPStatus.OK
+    assert principal_cache.get(student_id) is not None
+
+    response, _ = run(call("PUT", f"student/{student_id}", token,
+                           json={"Name": "Renamed Student", "Phone No": "9000000006"}))
+    assert response.status_code == HTTPStatus.OK, response.text
+    assert principal_cache.get(student_id) is None
@@ -0,0 +1,123 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import time
+import pytest
+from datetime import date
+from http import HTTPStatus
+from methods.db_methods import QueryCounter, run, database_available, reset_schema, seed, app_client
+
+if not run(database_available()):
+    pytest.skip("test database is not reachable", allow_module_level=True)
+
+from sqlalchemy import select
+from database.db import async_session
+from models.user import User, RoleEnum
+from models.course import Course, Batch, BatchStudent
+
+COHORT = 500
+
+
+async def seed_cohort(size=COHORT):
+    await reset_schema()
+    instructor = User(name="Batch Instructor", email="batch@kasadra.test", phone_no="9000000008",
+                      password="x", role=RoleEnum.instructor)
+    students = [
+        User(name=f"Student {i}", email=f"cohort{i}@kasadra.test", phone_no=f"8{i:09d}",
+             password="x", role=RoleEnum.student)
+        for i in range(size)
+    ]
+    await seed(instructor, *students)
+    courses = [
+        Course(instructor_id=instructor.id, title=f"Cohort course {i}", description="d", duration="4w")
+        for i in range(2)
+    ]
+    await seed(*courses)
+    batches = [
+        Batch(course_id=course.id, batch_name=f"{course.title} / {name}", num_students=size,
+              instructor_id=instructor.id, start_date=date(2026, 1, 5), end_date=date(2026, 3, 5))
+        for course in courses for name in ("A", "B")
+    ]
+    await seed(*batches)
+    return [s.id for s in students], batches
+
+
+async def post(method, path, payload):
+    async with app_client() as client:
+        with QueryCounter() as counter:
+            start = time.perf_counter()
+            response = await client.request(method, path, json=payload)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+    return response, counter.count, elapsed_ms
+
+
+async def placements(course_id):
+    async with async_session() as session:
+        result = await session.execute(
+            select(BatchStudent.student_id, BatchStudent.batch_id).where(BatchStudent.course_id == course_id)
+        )
+        return dict(result.all())
+
+
+# benchmark: a full cohort costs the same number of statements as one student
+def test_assign_cohort_query_count():
+    student_ids, batches = run(seed_cohort())
+    batch_a, batch_b, other_course_batch = batches[0], batches[1], batches[2]
+
+    # a quarter of the cohort already sits in batch A, a quarter in batch B,
+    # and everyone is enrolled in a batch of another course too
+    async def preseed():
+        await seed(*[
+            BatchStudent(student_id=sid, batch_id=(batch_b.id if i % 2 else batch_a.id),
+                         course_id=batch_a.course_id, batch_name="old")
+            for i, sid in enumerate(student_ids[:COHORT // 2])
+        ], *[
+            BatchStudent(student_id=sid, batch_id=other_course_batch.id,
+                         course_id=other_course_batch.course_id, batch_name=other_course_batch.batch_name)
+            for sid in student_ids
+        ])
+    run(preseed())
+
+    response, queries, elapsed_ms = run(post("POST", "batches/assign", {
+        "batch_id": batch_a.id, "student_ids": student_ids,
+    }))
+    print(f"\nassign {COHORT} students: {queries} queries, {elapsed_ms:.1f} ms")
+
+    assert response.status_code == HTTPStatus.OK, response.text
+    body = response.json()
+    assert len(body["already_in_same_batch"]) == COHORT // 4
+    assert len(body["moved"]) == COHORT // 4
+    assert body["new_assigned"] == student_ids[COHORT // 2:]
+    # batch lookup + existing placements + upsert
+    assert queries == 3, f"expected 3 queries, got {queries}"
+
+    assert set(run(placements(batch_a.course_id)).values()) == {batch_a.id}
+    assert set(run(placements(other_course_batch.course_id)).values()) == {other_course_batch.id}
+
+# update moves students between batches of the same course and reports new ones
+def test_update_student_batch():
+    student_ids, batches = run(seed_cohort(size=20))
+    batch_a, batch_b = batches[0], batches[1]
+    run(seed(*[
+        BatchStudent(student_id=sid, batch_id=batch_a.id, course_id=batch_a.course_id,
+                     batch_name=batch_a.batch_name)
+        for sid in student_ids[:10]
+    ]))
+
+    # duplicate ids in the request are only reported once
+    response, _, _ = run(post("PUT", "batches/update", {
+        "batch_id": batch_b.id, "student_ids": student_ids + student_ids[:3],
+    }))
+
+    assert response.status_code == HTTPStatus.OK, response.text
+    body = response.json()
+    assert body["moved_students"] == student_ids[:10]
+    assert body["assigned_new"] == student_ids[10:]
+    placed = run(placements(batch_b.course_id))
+    assert placed == {sid: batch_b.id for sid in student_ids}
+
+# unknown batch
+def test_assign_unknown_batch():
+    run(seed_cohort(size=1))
+    response, _, _ = run(post("POST", "batches/assign", {"batch_id": 9999, "student_ids": [1]}))
+    assert response.status_code == HTTPStatus.NOT_FOUND
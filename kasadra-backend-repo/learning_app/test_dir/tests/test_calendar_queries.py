@@ -0,0 +1,84 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pytest
+from datetime import date, timedelta
+from http import HTTPStatus
+from methods.db_methods import QueryCounter, run, database_available, reset_schema, seed, app_client
+
+if not run(database_available()):
+    pytest.skip("test database is not reachable", allow_module_level=True)
+
+from models.user import User, RoleEnum
+from models.course import Course, Lesson, Batch, BatchStudent, CourseCalendar
+
+SESSIONS = 200
+
+
+async def seed_calendar():
+    await reset_schema()
+    instructor = User(name="Cal Instructor", email="cal@kasadra.test", phone_no="9000000002",
+                      password="x", role=RoleEnum.instructor)
+    student = User(name="Cal Student", email="cal-student@kasadra.test", phone_no="9000000003",
+                   password="x", role=RoleEnum.student)
+    await seed(instructor, student)
+    course = Course(instructor_id=instructor.id, title="Calendar course", description="d", duration="8w")
+    await seed(course)
+
+    start = date(2026, 1, 5)
+    batches = [
+        Batch(course_id=course.id, batch_name=f"Batch {i}", num_students=30, instructor_id=instructor.id,
+              start_date=start, end_date=start + timedelta(days=90))
+        for i in range(2)
+    ]
+    lessons = [
+        Lesson(instructor_id=instructor.id, course_id=course.id, lesson_title=f"Lesson {i}", description="d")
+        for i in range(10)
+    ]
+    await seed(*batches, *lessons)
+    await seed(BatchStudent(student_id=student.id, batch_id=batches[0].id, course_id=course.id,
+                            batch_name=batches[0].batch_name))
+    await seed(*[
+        CourseCalendar(course_id=course.id, batch_id=batches[i % 2].id, lesson_id=lessons[i % 10].id,
+                       select_date=start + timedelta(days=i), day="Monday",
+                       start_time="10:00", end_time="11:00")
+        for i in range(SESSIONS)
+    ])
+    return course.id, student.id
+
+
+async def fetch(path):
+    async with app_client() as client:
+        with QueryCounter() as counter:
+            response = await client.get(path)
+    return response, counter.count
+
+
+# course calendar does not grow with the number of sessions
+def test_course_calendar_query_count():
+    course_id, _ = run(seed_calendar())
+    response, queries = run(fetch(f"scheduleclass/view/{course_id}"))
+
+    assert response.status_code == HTTPStatus.OK, response.text
+    data = response.json()["data"]
+    assert len(data) == SESSIONS
+    assert all(row["batch_name"] and row["lesson_title"] for row in data)
+    assert queries == 2, f"expected 2 queries, got {queries}"
+
+# student calendar does not grow with the number of sessions
+def test_student_calendar_query_count():
+    course_id, student_id = run(seed_calendar())
+    response, queries = run(fetch(f"scheduleclass/student/{student_id}/{course_id}"))
+
+    assert response.status_code == HTTPStatus.OK, response.text
+    body = response.json()
+    assert body["batch_name"] == "Batch 0"
+    assert len(body["data"]) == SESSIONS // 2
+    assert all(row["lesson_title"] for row in body["data"])
+    assert queries == 3, f"expected 3 queries, got {queries}"
+
+# student asking for a course they are not in
+def test_student_calendar_wrong_course():
+    course_id, student_id = run(seed_calendar())
+    response, _ = run(fetch(f"scheduleclass/student/{student_id}/{course_id + 1}"))
+    assert response.status_code == HTTPStatus.BAD_REQUEST
@@ -0,0 +1,152 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pytest
+from http import HTTPStatus
+from methods.db_methods import QueryCounter, run, database_available, reset_schema, seed, app_client
+from methods.fake_redis import FakeRedis
+
+if not run(database_available()):
+    pytest.skip("test database is not reachable", allow_module_level=True)
+
+from models.user import User, RoleEnum
+from models.course import Course, Lesson
+from models.add_to_cart import Cart
+from services.catalog_cache import catalog_cache
+from utils.cache import ReadCache, SharedBackend
+
+
+async def seed_catalog():
+    await reset_schema()
+    instructor = User(name="Cache Instructor", email="cache@kasadra.test", phone_no="9000000030",
+                      password="x", role=RoleEnum.instructor)
+    student = User(name="Cache Student", email="cache-student@kasadra.test", phone_no="9000000031",
+                   password="x", role=RoleEnum.student)
+    await seed(instructor, student)
+    courses = [
+        Course(instructor_id=instructor.id, title=f"Cached course {i}", description="d", duration="4w")
+        for i in range(3)
+    ]
+    await seed(*courses)
+    await seed(Lesson(instructor_id=instructor.id, course_id=courses[0].id, lesson_title="L1", description="d"),
+               Cart(student_id=student.id, course_id=courses[0].id))
+    return instructor.id, student.id, [c.id for c in courses]
+
+
+async def get(client, path):
+    with QueryCounter() as counter:
+        response = await client.get(path)
+    assert response.status_code in (HTTPStatus.OK, HTTPStatus.NOT_FOUND), response.text
+    return response, counter.count
+
+
+# repeated catalogue reads are served from the cache until a course is added
+def test_catalog_cached_until_course_added():
+    instructor_id, _, course_ids = run(seed_catalog())
+
+    async def scenario():
+        async with app_client() as client:
+            first, q1 = await get(client, "courses/all")
+            second, q2 = await get(client, "courses/all")
+            added = await client.post("courses/add", data={
+                "title": "Fresh course", "description": "d", "duration": "1w", "instructor_id": instructor_id,
+            })
+            third, q3 = await get(client, "courses/all")
+        return first, q1, second, q2, added, third, q3
+
+    first, q1, second, q2, added, third, q3 = run(scenario())
+    assert q1 == 1 and q2 == 0 and q3 == 1
+    assert first.json() == second.json()
+    assert added.status_code == HTTPStatus.OK, added.text
+    assert [c["title"] for c in third.json()["data"]][-1] == "Fresh course"
+
+# course detail and lesson lists are dropped when the course or its lessons change
+def test_course_and_lessons_invalidation():
+    instructor_id, _, course_ids = run(seed_catalog())
+    course_id = course_ids[0]
+
+    async def scenario():
+        async with app_client() as client:
+            _, q1 = await get(client, f"courses/{course_id}")
+            _, q2 = await get(client, f"courses/{course_id}")
+            lessons, _ = await get(client, f"lessons/all/{course_id}")
+            await client.post("lessons/add", json={
+                "instructor_id": instructor_id, "course_id": course_id, "title": "L2", "description": "d",
+            })
+            lessons_after, _ = await get(client, f"lessons/all/{course_id}")
+            await client.delete(f"courses/delete/{course_id}")
+            gone, _ = await get(client, f"courses/{course_id}")
+        return q1, q2, lessons, lessons_after, gone
+
+    q1, q2, lessons, lessons_after, gone = run(scenario())
+    assert (q1, q2) == (1, 0)
+    assert [l["title"] for l in lessons.json()["lessons"]] == ["L1"]
+    assert [l["title"] for l in lessons_after.json()["lessons"]] == ["L1", "L2"]
+    assert gone.status_code == HTTPStatus.NOT_FOUND
+
+# a purchase refreshes enrollment counts and the buyer's recommendations
+def test_purchase_invalidates_recommendations():
+    _, student_id, course_ids = run(seed_catalog())
+
+    async def scenario():
+        async with app_client() as client:
+            before, _ = await get(client, f"buy/all/{student_id}")
+            catalog_before, _ = await get(client, "courses/all")
+            await client.post(f"buy/{student_id}/{course_ids[0]}")
+            after, _ = await get(client, f"buy/all/{student_id}")
+            catalog_after, _ = await get(client, "courses/all")
+        return before, catalog_before, after, catalog_after
+
+    before, catalog_before, after, catalog_after = run(scenario())
+    assert [c["id"] for c in before.json()["data"]] == course_ids
+    assert [c["id"] for c in after.json()["data"]] == course_ids[1:]
+    assert catalog_before.json()["data"][0]["total_enrollments"] == 0
+    assert catalog_after.json()["data"][0]["total_enrollments"] == 1
+
+# two workers sharing a backend see each other's entries and invalidations
+def test_shared_backend_between_workers():
+    shared = FakeRedis()
+    worker_a = ReadCache("catalog", 30, SharedBackend(client=shared))
+    worker_b = ReadCache("catalog", 30, SharedBackend(client=shared))
+    loads = []
+
+    async def loader():
+        loads.append(1)
+        return {"courses": len(loads)}
+
+    async def scenario():
+        first = await worker_a.get_or_load("courses", ["catalog"], loader)
+        from_b = await worker_b.get_or_load("courses", ["catalog"], loader)
+        await worker_b.invalidate("catalog")
+        after = await worker_a.get_or_load("courses", ["catalog"], loader)
+        return first, from_b, after
+
+    first, from_b, after = run(scenario())
+    assert first == from_b == {"courses": 1}
+    assert after == {"courses": 2}
+    assert worker_b.stats()["hits"] == 1
+
+# a broken backend degrades to uncached reads
+def test_backend_errors_fall_back_to_loader():
+    class Down:
+        async def tag_versions(self, tags):
+            raise ConnectionError("cache down")
+
+        async def bump_tags(self, tags):
+            raise ConnectionError("cache down")
+
+        def stats(self):
+            return {"backend": "down"}
+
+    cache = ReadCache("catalog", 30, Down())
+
+    async def loader():
+        return {"ok": True}
+
+    async def scenario():
+        value = await cache.get_or_load("k", ["catalog"], loader)
+        await cache.invalidate("catalog")
+        return value
+
+    assert run(scenario()) == {"ok": True}
+    assert cache.stats()["errors"] == 2
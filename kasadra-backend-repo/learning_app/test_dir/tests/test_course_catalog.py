@@ -0,0 +1,103 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pytest
+from http import HTTPStatus
+from methods.db_methods import QueryCounter, run, database_available, reset_schema, seed, app_client
+
+if not run(database_available()):
+    pytest.skip("test database is not reachable", allow_module_level=True)
+
+from models.user import User, RoleEnum
+from models.course import Course
+from models.purchased_courses import PurchasedCourse
+from services.course_catalog import COURSE_PAGE_MAX
+from services.enrollment_counts import reconcile_enrollment_counts
+from database.db import async_session
+
+COURSES = 120
+
+
+async def seed_catalog():
+    await reset_schema()
+    instructors = [
+        User(name=f"Catalog Instructor {i}", email=f"catalog{i}@kasadra.test", phone_no=f"900000010{i}",
+             password="x", role=RoleEnum.instructor)
+        for i in range(2)
+    ]
+    students = [
+        User(name=f"Buyer {i}", email=f"buyer{i}@kasadra.test", phone_no=f"700000000{i}",
+             password="x", role=RoleEnum.student)
+        for i in range(3)
+    ]
+    await seed(*instructors, *students)
+    courses = [
+        Course(instructor_id=instructors[i % 2].id, title=f"{'Python' if i % 10 == 0 else 'Course'} {i}",
+               description="d", duration="4w")
+        for i in range(COURSES)
+    ]
+    await seed(*courses)
+    # course i has i % 4 enrollments (capped by the number of students)
+    await seed(*[
+        PurchasedCourse(student_id=students[s].id, course_id=course.id)
+        for i, course in enumerate(courses) for s in range(min(i % 4, len(students)))
+    ])
+    async with async_session() as db:
+        await reconcile_enrollment_counts(db)
+    return [c.id for c in courses], instructors[0].id
+
+
+async def walk(params):
+    """Follow next_cursor until the last page; return pages and per-page query counts."""
+    pages, queries = [], []
+    async with app_client() as client:
+        cursor = None
+        while True:
+            with QueryCounter() as counter:
+                response = await client.get("courses/all", params={**params, **({"cursor": cursor} if cursor else {})})
+            assert response.status_code == HTTPStatus.OK, response.text
+            pages.append(response.json())
+            queries.append(counter.count)
+            cursor = pages[-1]["page"]["next_cursor"]
+            if not cursor:
+                return pages, queries
+
+
+# every course shows up exactly once, in id order, one statement per page
+def test_keyset_pages_cover_catalog():
+    course_ids, _ = run(seed_catalog())
+    pages, queries = run(walk({"limit": 50}))
+
+    assert [len(p["data"]) for p in pages] == [50, 50, 20]
+    assert [p["page"]["has_more"] for p in pages] == [True, True, False]
+    assert [c["id"] for p in pages for c in p["data"]] == course_ids
+    assert queries == [1, 1, 1]
+
+    counts = {c["id"]: c["total_enrollments"] for p in pages for c in p["data"]}
+    assert counts == {cid: min(i % 4, 3) for i, cid in enumerate(course_ids)}
+    assert all(c["instructor_name"] for p in pages for c in p["data"])
+
+# filters apply before paging
+def test_filters():
+    course_ids, instructor_id = run(seed_catalog())
+    pages, _ = run(walk({"instructor_id": instructor_id, "q": "pyTHon", "limit": 5}))
+
+    found = [c for p in pages for c in p["data"]]
+    assert [c["id"] for c in found] == course_ids[0::10]
+    assert all(c["instructor_id"] == instructor_id for c in found)
+
+# limit is capped and bad cursors are rejected
+def test_limit_cap_and_bad_cursor():
+    run(seed_catalog())
+
+    async def scenario():
+        async with app_client() as client:
+            big = await client.get("courses/all", params={"limit": 10_000})
+            bad = await client.get("courses/all", params={"cursor": "not-a-cursor"})
+        return big, bad
+
+    big, bad = run(scenario())
+    assert big.status_code == HTTPStatus.OK
+    assert len(big.json()["data"]) == COURSE_PAGE_MAX
+    assert big.json()["page"]["limit"] == COURSE_PAGE_MAX
+    assert bad.status_code == HTTPStatus.BAD_REQUEST
@@ -0,0 +1,90 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pytest
+from http import HTTPStatus
+from methods.db_methods import run, database_available, reset_schema, seed, app_client
+from methods.fake_gcs import FakeStorageClient
+
+if not run(database_available()):
+    pytest.skip("test database is not reachable", allow_module_level=True)
+
+from models.user import User, RoleEnum
+from models.course import Course, Lesson
+from utils import gcp
+
+
+@pytest.fixture
+def fake_gcs():
+    previous = gcp._storage_client
+    client = FakeStorageClient()
+    gcp.set_storage_client(client)
+    yield client
+    gcp.set_storage_client(previous)
+
+
+async def seed_lesson():
+    await reset_schema()
+    instructor = User(name="Upload Instructor", email="upload@kasadra.test", phone_no="9000000007",
+                      password="x", role=RoleEnum.instructor)
+    await seed(instructor)
+    course = Course(instructor_id=instructor.id, title="Upload course", description="d", duration="2w")
+    await seed(course)
+    lesson = Lesson(instructor_id=instructor.id, course_id=course.id, lesson_title="L1", description="d")
+    await seed(lesson)
+    return course.id, lesson.id
+
+
+# pdf bytes go straight to storage, the API only signs and confirms
+def test_pdf_signed_upload_flow(fake_gcs):
+    course_id, lesson_id = run(seed_lesson())
+    ids = {"course_id": course_id, "lesson_id": lesson_id}
+
+    async def scenario():
+        async with app_client() as client:
+            issued = await client.post("contents/upload-url/pdf",
+                                       json={**ids, "filename": "week1.pdf", "content_type": "application/pdf"})
+            upload = issued.json()["data"]
+
+            early = await client.post("contents/confirm/pdf", json={**ids, "object_name": upload["object_name"]})
+            fake_gcs.put_signed_url(upload["upload_url"], b"%PDF-1.4 direct")
+            confirmed = await client.post("contents/confirm/pdf", json={**ids, "object_name": upload["object_name"]})
+            lesson = await client.get(f"lessons{lesson_id}")
+        return issued, upload, early, confirmed, lesson
+
+    issued, upload, early, confirmed, lesson = run(scenario())
+    assert issued.status_code == HTTPStatus.OK, issued.text
+    assert upload["object_name"].startswith("pdfs/")
+    assert upload["headers"] == {"Content-Type": "application/pdf"}
+    assert early.status_code == HTTPStatus.CONFLICT
+    assert confirmed.status_code == HTTPStatus.OK, confirmed.text
+    assert confirmed.json()["data"]["file_url"] == upload["file_url"]
+    assert [p["file_url"] for p in lesson.json()["data"]["pdfs"]] == [upload["file_url"]]
+    assert fake_gcs.chunks_uploaded == 0  # nothing was proxied through the API
+
+# an object issued for another content type is rejected
+def test_confirm_rejects_foreign_object(fake_gcs):
+    course_id, lesson_id = run(seed_lesson())
+    fake_gcs.bucket(gcp.GCS_BUCKET_NAME).objects["pdfs/x_week1.pdf"] = b"pdf"
+
+    async def scenario():
+        async with app_client() as client:
+            return await client.post("contents/confirm/lab", json={
+                "course_id": course_id, "lesson_id": lesson_id, "name": "Lab 1", "object_name": "pdfs/x_week1.pdf",
+            })
+
+    assert run(scenario()).status_code == HTTPStatus.BAD_REQUEST
+
+# quiz confirm without a file just records the quiz
+def test_quiz_confirm_without_file(fake_gcs):
+    course_id, lesson_id = run(seed_lesson())
+
+    async def scenario():
+        async with app_client() as client:
+            return await client.post("contents/confirm/quiz", json={
+                "course_id": course_id, "lesson_id": lesson_id, "name": "Quiz 1", "url": "https://quiz",
+            })
+
+    response = run(scenario())
+    assert response.status_code == HTTPStatus.OK, response.text
+    assert response.json()["data"]["file_url"] is None
@@ -0,0 +1,58 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+import asyncio
+import io
+import pytest
+from starlette.datastructures import UploadFile, Headers
+from methods.fake_gcs import FakeStorageClient
+from utils import gcp
+
+
+def make_upload(name, payload):
+    return UploadFile(file=io.BytesIO(payload), filename=name, size=len(payload),
+                      headers=Headers({"content-type": "application/pdf"}))
+
+@pytest.fixture
+def fake_gcs():
+    previous = gcp._storage_client
+    client = FakeStorageClient(latency=0.05)
+    gcp.set_storage_client(client)
+    yield client
+    gcp.set_storage_client(previous)
+
+
+# small files are uploaded in one request and land intact
+def test_upload_small_file(fake_gcs):
+    payload = b"%PDF-1.4 small"
+    url = asyncio.run(gcp.upload_file_to_gcs(make_upload("notes.pdf", payload), "pdfs"))
+
+    name = url.split(f"{gcp.GCS_BUCKET_NAME}/", 1)[1]
+    assert name.startswith("pdfs/") and name.endswith("_notes.pdf")
+    assert fake_gcs.bucket(gcp.GCS_BUCKET_NAME).objects[name] == payload
+    assert fake_gcs.chunks_uploaded == 1
+
+# large files stream in chunks
+def test_upload_large_file_is_chunked(fake_gcs, monkeypatch):
+    monkeypatch.setattr(gcp, "GCS_RESUMABLE_THRESHOLD", 1024)
+    monkeypatch.setattr(gcp, "GCS_UPLOAD_CHUNK_SIZE", 256 * 1024)
+    payload = os.urandom(256 * 1024 * 3 + 10)
+    url = asyncio.run(gcp.upload_file_to_gcs(make_upload("lab.zip", payload), "lab-files"))
+
+    name = url.split(f"{gcp.GCS_BUCKET_NAME}/", 1)[1]
+    assert fake_gcs.bucket(gcp.GCS_BUCKET_NAME).objects[name] == payload
+    assert fake_gcs.chunks_uploaded == 4
+
+# uploads run off the event loop, so concurrent uploads overlap
+def test_uploads_do_not_block_event_loop(fake_gcs):
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await asyncio.gather(*[
+            gcp.upload_file_to_gcs(make_upload(f"f{i}.pdf", b"x"), "pdfs") for i in range(4)
+        ])
+        return loop.time() - start
+
+    elapsed = asyncio.run(scenario())
+    assert elapsed < 4 * fake_gcs.latency
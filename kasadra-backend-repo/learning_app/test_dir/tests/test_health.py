@@ -0,0 +1,31 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import requests
+import pytest
+from http import HTTPStatus
+from methods.api_methods import APIS
+
+@pytest.fixture(scope='module')
+def apis():
+    return APIS()
+
+def validate_response(response, expected_status):
+    assert response.status_code == expected_status, \
+        f"Unexpected status code: {response.status_code}, Response: {response.text}"
+
+
+# health check
+def test_health_check(apis):
+    get_response = apis.get('')
+    validate_response(get_response, HTTPStatus.OK)
+    assert get_response.json()["status"] == "ok"
+
+# db pool metrics
+def test_db_pool_metrics(apis):
+    get_response = apis.get('health/db-pool')
+    validate_response(get_response, HTTPStatus.OK)
+    data = get_response.json()["data"]
+    for key in ("pool_size", "in_use", "checkouts", "checkout_wait_total_ms", "checkout_wait_max_ms"):
+        assert key in data, f"Missing pool metric '{key}'"
+    assert data["in_use"] <= data["pool_size"] + data["max_overflow"]
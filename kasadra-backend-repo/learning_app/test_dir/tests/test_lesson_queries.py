@@ -0,0 +1,74 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import time
+import pytest
+from http import HTTPStatus
+from methods.db_methods import QueryCounter, run, database_available, reset_schema, seed, app_client
+
+if not run(database_available()):
+    pytest.skip("test database is not reachable", allow_module_level=True)
+
+from models.user import User, RoleEnum
+from models.course import Course, Lesson, Pdf, WebLink, Quiz, Lab, Note
+
+CONTENT_PER_TYPE = 3
+
+
+async def seed_lesson():
+    await reset_schema()
+    instructor = User(name="Bench Instructor", email="bench@kasadra.test", phone_no="9000000001",
+                      password="x", role=RoleEnum.instructor)
+    await seed(instructor)
+    course = Course(instructor_id=instructor.id, title="Bench course", description="d", duration="4w")
+    await seed(course)
+    lesson = Lesson(instructor_id=instructor.id, course_id=course.id, lesson_title="L1", description="d")
+    await seed(lesson)
+
+    content = []
+    for i in range(CONTENT_PER_TYPE):
+        content += [
+            Pdf(course_id=course.id, lesson_id=lesson.id, file_url=f"https://files/{i}.pdf"),
+            WebLink(course_id=course.id, lesson_id=lesson.id, link_url=f"https://link/{i}"),
+            Quiz(course_id=course.id, lesson_id=lesson.id, name=f"quiz {i}", url="https://quiz"),
+            Lab(course_id=course.id, lesson_id=lesson.id, name=f"lab {i}", url="https://lab"),
+            Note(course_id=course.id, lesson_id=lesson.id, instructor_id=instructor.id, notes=f"note {i}"),
+        ]
+    await seed(*content)
+    return lesson.id
+
+
+async def fetch_lesson(lesson_id):
+    async with app_client() as client:
+        with QueryCounter() as counter:
+            start = time.perf_counter()
+            response = await client.get(f"lessons{lesson_id}")
+            elapsed_ms = (time.perf_counter() - start) * 1000
+    return response, counter.count, elapsed_ms
+
+
+# lesson detail is served by a single statement
+def test_get_lesson_by_id_query_count():
+    lesson_id = run(seed_lesson())
+    response, queries, elapsed_ms = run(fetch_lesson(lesson_id))
+    print(f"GET /lessons{{id}}: {queries} queries, {elapsed_ms:.1f} ms")
+
+    assert response.status_code == HTTPStatus.OK, response.text
+    assert queries == 1, f"expected 1 query, got {queries}"
+
+    data = response.json()["data"]
+    assert data["lesson_id"] == lesson_id
+    for key in ("pdfs", "weblinks", "quizzes", "labs", "notes"):
+        assert len(data[key]) == CONTENT_PER_TYPE, key
+    assert set(data["pdfs"][0]) == {"id", "file_url"}
+    assert set(data["weblinks"][0]) == {"id", "url"}
+    assert set(data["quizzes"][0]) == {"id", "name", "description", "url", "file_url"}
+    assert set(data["labs"][0]) == {"id", "name", "description", "url", "file_url"}
+    assert set(data["notes"][0]) == {"id", "course_id", "lesson_id", "instructor_id", "notes"}
+
+# missing lesson still 404s
+def test_get_lesson_by_id_not_found():
+    run(seed_lesson())
+    response, queries, _ = run(fetch_lesson(999999))
+    assert response.status_code == HTTPStatus.NOT_FOUND
+    assert queries == 1
@@ -0,0 +1,93 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import asyncio
+import shutil
+import pytest
+from methods.db_methods import run, database_available, drop_schema
+
+if not run(database_available()):
+    pytest.skip("test database is not reachable", allow_module_level=True)
+
+from sqlalchemy import inspect, text
+from database.db import Base, load_models
+from database.dbconfig import engine
+from database.migrate import (MIGRATIONS_DIR, SchemaVersionError, applied_versions, head_version,
+                              migrate, verify_schema_version)
+
+
+def reflect(sync_conn):
+    inspector = inspect(sync_conn)
+    return {
+        table: {column["name"] for column in inspector.get_columns(table)}
+        for table in inspector.get_table_names() if table != "schema_migrations"
+    }
+
+
+# the migrations build exactly the schema the models describe
+def test_migrations_match_models():
+    load_models()
+
+    async def scenario():
+        await drop_schema()
+        await migrate(engine)
+        async with engine.connect() as conn:
+            return await conn.run_sync(reflect)
+
+    migrated = run(scenario())
+    expected = {table.name: {c.name for c in table.columns} for table in Base.metadata.sorted_tables}
+    assert migrated == expected
+
+# several deploys migrating at once apply each script exactly once
+def test_concurrent_migrate():
+    async def scenario():
+        await drop_schema()
+        results = await asyncio.gather(*[migrate(engine) for _ in range(4)])
+        async with engine.connect() as conn:
+            versions = await applied_versions(conn)
+        return results, versions
+
+    results, versions = run(scenario())
+    assert sorted(len(r) for r in results) == [0, 0, 0, len(versions)]
+    assert versions[-1] == head_version()
+
+# boot refuses an outdated schema and passes once it is migrated
+def test_verify_schema_version(tmp_path):
+    migrations = tmp_path / "migrations"
+    shutil.copytree(MIGRATIONS_DIR, migrations, ignore=shutil.ignore_patterns("__pycache__"))
+    future = head_version() + 1
+    (migrations / f"{future:04d}_future_column.py").write_text(
+        "from database.migrate import run_sql\n\n\n"
+        "async def upgrade(conn):\n"
+        "    await run_sql(conn, 'ALTER TABLE courses ADD COLUMN future_flag BOOLEAN')\n"
+    )
+
+    async def scenario():
+        await drop_schema()
+        await migrate(engine)
+        current = await verify_schema_version(engine)
+        with pytest.raises(SchemaVersionError):
+            await verify_schema_version(engine, str(migrations))
+        await migrate(engine, directory=str(migrations))
+        return current, await verify_schema_version(engine, str(migrations))
+
+    assert run(scenario()) == (head_version(), future)
+
+# a database built by the old startup create_all adopts the baseline as-is
+def test_baseline_on_create_all_database():
+    load_models()
+
+    async def scenario():
+        await drop_schema()
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.execute(text("INSERT INTO users (name, email, phone_no, password, role) "
+                                    "VALUES ('old', 'old@kasadra.test', '1', 'x', 'student')"))
+        applied = await migrate(engine)
+        async with engine.connect() as conn:
+            users = await conn.scalar(text("SELECT count(*) FROM users"))
+        return applied, users
+
+    applied, users = run(scenario())
+    assert [m.version for m in applied][0] == 1
+    assert users == 1
@@ -0,0 +1,49 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+import asyncio
+import time
+import pytest
+from utils.passwd import (
+    hash_password, hash_password_async, verify_password_async, password_pool_stats, PASSWORD_HASH_WORKERS
+)
+
+
+# async wrappers agree with the sync helpers
+def test_async_hash_and_verify():
+    async def scenario():
+        hashed = await hash_password_async("S3cret!pass")
+        return await verify_password_async("S3cret!pass", hashed), await verify_password_async("wrong", hashed)
+
+    assert asyncio.run(scenario()) == (True, False)
+
+# the event loop keeps ticking while a login storm is being hashed
+def test_login_storm_does_not_block_event_loop():
+    hashed = hash_password("S3cret!pass")
+    logins = PASSWORD_HASH_WORKERS * 4
+
+    async def scenario():
+        ticks = 0
+        stop = False
+
+        async def heartbeat():
+            nonlocal ticks
+            while not stop:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        beat = asyncio.create_task(heartbeat())
+        start = time.perf_counter()
+        results = await asyncio.gather(*[verify_password_async("S3cret!pass", hashed) for _ in range(logins)])
+        elapsed = time.perf_counter() - start
+        stop = True
+        await beat
+        return results, ticks, elapsed
+
+    results, ticks, elapsed = asyncio.run(scenario())
+    assert all(results)
+    # a blocked loop would tick about once for the whole storm
+    assert ticks >= 5, f"event loop ticked {ticks} times in {elapsed:.2f}s"
+    stats = password_pool_stats()
+    assert stats["in_flight"] == 0
+    assert stats["max_queue_depth"] >= logins - PASSWORD_HASH_WORKERS
@@ -0,0 +1,28 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+import pytest
+from database.query_log import normalize_statement, fingerprint
+
+
+# literals and bind markers are stripped
+def test_normalize_statement_strips_values():
+    sql = "SELECT users.id FROM users WHERE users.email = $1::VARCHAR AND users.id = 42 AND name = 'bob'"
+    assert normalize_statement(sql) == \
+        "SELECT users.id FROM users WHERE users.email = ? AND users.id = ? AND name = ?"
+
+# IN lists of any length collapse to one shape
+def test_normalize_statement_collapses_in_lists():
+    short = "SELECT * FROM pdfs WHERE pdfs.lesson_id IN ($1::INTEGER, $2::INTEGER)"
+    long = "SELECT * FROM pdfs WHERE pdfs.lesson_id IN ($1::INTEGER, $2::INTEGER, $3::INTEGER, $4::INTEGER)"
+    assert fingerprint(short) == fingerprint(long)
+    assert "IN (...)" in normalize_statement(short)
+
+# different queries keep different fingerprints
+def test_fingerprint_differs_per_query():
+    assert fingerprint("SELECT * FROM pdfs WHERE lesson_id = $1") != \
+        fingerprint("SELECT * FROM labs WHERE lesson_id = $1")
+
+# postgres casts are not mistaken for named binds
+def test_normalize_statement_keeps_casts():
+    assert normalize_statement("SELECT now()::date") == "SELECT now()::date"
@@ -0,0 +1,153 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pytest
+from methods.db_methods import run, database_available, reset_schema
+
+if not run(database_available()):
+    pytest.skip("test database is not reachable", allow_module_level=True)
+
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+from database.dbconfig import engine
+from models.course import Batch, BatchStudent, Lesson, MeetingLink, Note
+from models.add_to_cart import Cart
+from models.purchased_courses import PurchasedCourse
+from services.calendar import calendar_query
+from services.course_catalog import course_page_query
+from services.lesson_content import lesson_bundle_query
+from models.course import CourseCalendar
+
+# 50 instructors x 4 courses x 10 lessons, a few content rows per lesson,
+# enough that the planner has real statistics to work with.
+SEED = [
+    "INSERT INTO users (id, name, email, phone_no, password, role) "
+    "SELECT g, 'user ' || g, 'user' || g || '@kasadra.test', (9000000000 + g)::text, 'x', "
+    "CASE WHEN g <= 50 THEN 'instructor'::roleenum ELSE 'student'::roleenum END "
+    "FROM generate_series(1, 2050) g",
+    "INSERT INTO courses (id, instructor_id, title, description, duration) "
+    "SELECT g, (g - 1) % 50 + 1, 'course ' || g, 'd', '4w' FROM generate_series(1, 200) g",
+    "INSERT INTO lessons (id, instructor_id, course_id, lesson_title, description) "
+    "SELECT g, 1, (g - 1) % 200 + 1, 'lesson ' || g, 'd' FROM generate_series(1, 2000) g",
+    "INSERT INTO pdfs (course_id, lesson_id, file_url) "
+    "SELECT 1, (g - 1) % 2000 + 1, 'f' FROM generate_series(1, 6000) g",
+    "INSERT INTO weblinks (course_id, lesson_id, link_url) "
+    "SELECT 1, (g - 1) % 2000 + 1, 'l' FROM generate_series(1, 6000) g",
+    "INSERT INTO quiz (course_id, lesson_id, name) "
+    "SELECT 1, (g - 1) % 2000 + 1, 'q' FROM generate_series(1, 6000) g",
+    "INSERT INTO labs (course_id, lesson_id, name) "
+    "SELECT 1, (g - 1) % 2000 + 1, 'l' FROM generate_series(1, 6000) g",
+    "INSERT INTO notes (course_id, lesson_id, instructor_id, notes) "
+    "SELECT (g - 1) % 200 + 1, (g - 1) % 2000 + 1, 1, 'n' FROM generate_series(1, 6000) g",
+    "INSERT INTO batches (id, course_id, batch_name, num_students, instructor_id, start_date, end_date) "
+    "SELECT g, (g - 1) % 200 + 1, 'batch ' || g, 30, 1, current_date, current_date + 30 "
+    "FROM generate_series(1, 800) g",
+    "INSERT INTO course_calendar (course_id, batch_id, select_date, day, start_time) "
+    "SELECT (g - 1) % 200 + 1, (g - 1) % 800 + 1, current_date + g % 60, 'Mon', '10:00' "
+    "FROM generate_series(1, 8000) g",
+    "INSERT INTO purchased_courses (student_id, course_id) "
+    "SELECT 51 + (g - 1) % 2000, (g - 1) % 200 + 1 FROM generate_series(1, 8000) g",
+    "INSERT INTO add_to_cart (student_id, course_id) "
+    "SELECT 51 + (g - 1) % 2000, (g * 7) % 200 + 1 FROM generate_series(1, 4000) g",
+    "INSERT INTO batch_students (student_id, batch_id, course_id) "
+    "SELECT 51 + (g - 1) % 2000, (g - 1) % 800 + 1, (g + (g - 1) / 2000) % 200 + 1 "
+    "FROM generate_series(1, 4000) g",
+    "INSERT INTO meeting_links (instructor_id, course_id, batch_id, meeting_url) "
+    "SELECT (g - 1) % 50 + 1, (g - 1) % 200 + 1, (g - 1) % 800 + 1, 'https://meet' "
+    "FROM generate_series(1, 800) g",
+    "ANALYZE",
+]
+
+# the hot queries, built the way the app builds them, and the index each must use
+HOT_QUERIES = {
+    "lesson bundle": (
+        lesson_bundle_query().where(Lesson.id == 42),
+        {"ix_pdfs_lesson_id_id", "ix_weblinks_lesson_id_id", "ix_quiz_lesson_id_id",
+         "ix_labs_lesson_id_id", "ix_notes_lesson_id_id"},
+    ),
+    "lessons by course": (
+        select(Lesson).where(Lesson.course_id == 7),
+        {"ix_lessons_course_id_id"},
+    ),
+    "course calendar": (
+        calendar_query().where(CourseCalendar.course_id == 7),
+        {"ix_course_calendar_course_schedule"},
+    ),
+    "batch calendar": (
+        calendar_query().where(CourseCalendar.batch_id == 7),
+        {"ix_course_calendar_batch_schedule"},
+    ),
+    "lesson notes": (
+        select(Note).where(Note.course_id == 42, Note.lesson_id == 42, Note.instructor_id == 1),
+        {"ix_notes_lesson_id_id"},
+    ),
+    "purchases by student": (
+        select(PurchasedCourse.course_id).where(PurchasedCourse.student_id == 100),
+        {"ix_purchased_courses_student_course"},
+    ),
+    "purchases by course": (
+        select(PurchasedCourse).where(PurchasedCourse.course_id == 7),
+        {"ix_purchased_courses_course_id"},
+    ),
+    "cart lookup": (
+        select(Cart).where(Cart.student_id == 100, Cart.course_id == 8),
+        {"ix_add_to_cart_student_course"},
+    ),
+    "batches by course": (
+        select(Batch).where(Batch.course_id == 7),
+        {"ix_batches_course_id"},
+    ),
+    "batch roster": (
+        select(BatchStudent).where(BatchStudent.batch_id == 7),
+        {"ix_batch_students_batch_id"},
+    ),
+    "student batches": (
+        select(BatchStudent).where(BatchStudent.student_id == 100),
+        {"unique_student_course_assignment"},
+    ),
+    "meetings by batch": (
+        select(MeetingLink).where(MeetingLink.batch_id == 7),
+        {"ix_meeting_links_batch_id"},
+    ),
+    "meetings by instructor": (
+        select(MeetingLink).where(MeetingLink.instructor_id == 7),
+        {"ix_meeting_links_instructor_id"},
+    ),
+    "catalogue by instructor": (
+        course_page_query(after_id=20, limit=50, instructor_id=7),
+        {"ix_courses_instructor_id_id"},
+    ),
+}
+
+
+def index_names(plan):
+    names = {plan["Index Name"]} if "Index Name" in plan else set()
+    for child in plan.get("Plans", []):
+        names |= index_names(child)
+    return names
+
+
+async def explain_all():
+    await reset_schema()
+    plans = {}
+    async with engine.connect() as conn:
+        for statement in SEED:
+            await conn.execute(text(statement))
+        await conn.commit()
+        for name, (stmt, _) in HOT_QUERIES.items():
+            sql = str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+            result = await conn.execute(text("EXPLAIN (FORMAT JSON) " + sql))
+            plans[name] = index_names(result.scalar()[0]["Plan"])
+    return plans
+
+
+@pytest.fixture(scope="module")
+def plans():
+    return run(explain_all())
+
+
+# every hot filter is answered from its index, not a scan of the whole table
+@pytest.mark.parametrize("name", list(HOT_QUERIES))
+def test_hot_query_uses_index(plans, name):
+    expected = HOT_QUERIES[name][1]
+    assert expected <= plans[name], f"{name}: plan used {sorted(plans[name])}"
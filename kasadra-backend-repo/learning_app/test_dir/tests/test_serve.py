@@ -0,0 +1,26 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from methods import db_methods  # noqa: F401  (puts learning_app on sys.path)
+
+import serve
+
+
+# launcher settings come from the environment, with safe defaults
+def test_load_settings():
+    settings = serve.load_settings({
+        "WEB_CONCURRENCY": "3", "PORT": "9000", "WEB_LOOP": "asyncio", "WEB_HTTP": "h11",
+        "WEB_MAX_REQUESTS": "0",
+    })
+    assert (settings.workers, settings.port, settings.loop, settings.http) == (3, 9000, "asyncio", "h11")
+
+    config = serve.uvicorn_config(settings)
+    assert config.workers == 3
+    assert config.limit_max_requests is None  # 0 disables recycling
+    assert config.limit_max_requests_jitter == 0
+
+    defaults = serve.load_settings({})
+    assert defaults.workers >= 1
+    assert defaults.loop in ("uvloop", "asyncio")
+    assert defaults.http in ("httptools", "h11")
+    assert serve.uvicorn_config(defaults).timeout_graceful_shutdown == defaults.graceful_timeout
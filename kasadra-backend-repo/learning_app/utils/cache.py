@@ -0,0 +1,237 @@
+#####################################################################
+## In-process TTL / LRU cache
+#####################################################################
+
+import json
+import logging
+import math
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+from fastapi.encoders import jsonable_encoder
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Size-bounded LRU cache whose entries also expire after `ttl` seconds.
+
+    Meant for the event loop thread: every operation is synchronous, so no
+    locking is needed as long as it is not shared with worker threads.
+    """
+
+    def __init__(self, name: str, ttl: float, max_entries: int):
+        self.name = name
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key, _MISSING)
+        if entry is _MISSING:
+            self.misses += 1
+            return default
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        if self.max_entries <= 0:
+            return
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable):
+        if self._data.pop(key, _MISSING) is not _MISSING:
+            self.invalidations += 1
+
+    def clear(self):
+        self.invalidations += len(self._data)
+        self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "name": self.name,
+            "entries": len(self._data),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+#####################################################################
+## Read-model cache with tag invalidation
+#####################################################################
+
+# ReadCache sits in front of expensive read paths (catalogue pages, course
+# detail, ...). Every entry is filed under one or more tags, and the key it
+# is stored under embeds the current version of each tag. A write bumps the
+# versions of the tags it touches, so all entries built from the old data
+# become unreachable at once and simply age out. A reader that loaded data
+# before a concurrent write stores it under the old versions, so it cannot
+# resurrect stale data either.
+#
+# Storage is a backend with a small async interface. InProcessBackend (the
+# default) keeps entries per worker process; SharedBackend talks to a
+# Redis-compatible server so invalidations reach every worker. Backend
+# errors are logged and treated as misses, never surfaced to the request.
+
+logger = logging.getLogger("kasadra.cache")
+
+
+class InProcessBackend:
+    def __init__(self, name: str, ttl: float, max_entries: int):
+        self.entries = TTLCache(name, ttl, max_entries)
+        self.versions = {}
+
+    async def get(self, key):
+        return self.entries.get(key)
+
+    async def set(self, key, value, ttl: float):
+        self.entries.set(key, value, ttl)
+
+    async def tag_versions(self, tags):
+        return [self.versions.get(tag, 0) for tag in tags]
+
+    async def bump_tags(self, tags):
+        for tag in tags:
+            self.versions[tag] = self.versions.get(tag, 0) + 1
+
+    def stats(self) -> dict:
+        return {
+            "backend": "in-process",
+            "entries": len(self.entries),
+            "max_entries": self.entries.max_entries,
+            "evictions": self.entries.evictions,
+        }
+
+
+class SharedBackend:
+    """Redis-compatible backend (redis.asyncio API: get/set/mget/incr).
+
+    Pass `client` to use any compatible object, e.g. a local stand-in in tests;
+    otherwise one is created from `url` with the optional `redis` package.
+    """
+
+    def __init__(self, client=None, url: Optional[str] = None, prefix: str = "kasadra:cache:"):
+        if client is None:
+            import redis.asyncio as redis  # optional dependency, only needed for a shared cache
+            client = redis.from_url(url)
+        self.client = client
+        self.prefix = prefix
+
+    async def get(self, key):
+        raw = await self.client.get(self.prefix + key)
+        return None if raw is None else json.loads(raw)
+
+    async def set(self, key, value, ttl: float):
+        await self.client.set(self.prefix + key, json.dumps(value), ex=max(1, math.ceil(ttl)))
+
+    async def tag_versions(self, tags):
+        raw = await self.client.mget([f"{self.prefix}tag:{tag}" for tag in tags])
+        return [int(v) if v is not None else 0 for v in raw]
+
+    async def bump_tags(self, tags):
+        for tag in tags:
+            await self.client.incr(f"{self.prefix}tag:{tag}")
+
+    def stats(self) -> dict:
+        return {"backend": "shared", "prefix": self.prefix}
+
+
+class ReadCache:
+    def __init__(self, name: str, ttl: float, backend):
+        self.name = name
+        self.ttl = ttl
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.errors = 0
+
+    def set_backend(self, backend):
+        self.backend = backend
+
+    async def _versioned_key(self, key: str, tags) -> str:
+        versions = await self.backend.tag_versions(tags)
+        return f"{self.name}:{key}@" + ".".join(map(str, versions))
+
+    async def get_or_load(self, key: str, tags, loader, ttl: Optional[float] = None):
+        """Return the cached value for `key`, or await `loader()` and cache it.
+
+        The value is stored JSON-encoded (dates become ISO strings), exactly
+        as it would be rendered in a response. None is never cached.
+        """
+        full_key = None
+        if self.ttl > 0:
+            try:
+                full_key = await self._versioned_key(key, tags)
+                value = await self.backend.get(full_key)
+                if value is not None:
+                    self.hits += 1
+                    return value
+            except Exception:
+                self.errors += 1
+                logger.exception("cache %s: read failed for %s", self.name, key)
+                full_key = None
+
+        self.misses += 1
+        value = await loader()
+        if value is None:
+            return None
+        value = jsonable_encoder(value)
+
+        if full_key is not None:
+            try:
+                await self.backend.set(full_key, value, self.ttl if ttl is None else ttl)
+            except Exception:
+                self.errors += 1
+                logger.exception("cache %s: write failed for %s", self.name, key)
+        return value
+
+    async def invalidate(self, *tags):
+        """Drop every entry filed under any of `tags`. Call after the write commits."""
+        if not tags:
+            return
+        self.invalidations += 1
+        try:
+            await self.backend.bump_tags(tags)
+        except Exception:
+            self.errors += 1
+            logger.exception("cache %s: invalidation failed for %s", self.name, tags)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            **self.backend.stats(),
+            "name": self.name,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "tag_invalidations": self.invalidations,
+            "errors": self.errors,
+        }
@@ -1,16 +1,106 @@
-from google.cloud import storage
+import asyncio
+import os
 import uuid
+from datetime import timedelta
+
+from google.cloud import storage
+
+GCS_BUCKET_NAME = os.getenv("GCS_BUCKET_NAME") or "kasadra-project-bucket"
+
+# Files above the threshold go up as a resumable upload, streamed straight
+# from the request's spooled temp file in chunks (chunk size must be a
+# multiple of 256 KiB). Smaller files use a single request.
+GCS_RESUMABLE_THRESHOLD = int(os.getenv("GCS_RESUMABLE_THRESHOLD") or 8 * 1024 * 1024)
+GCS_UPLOAD_CHUNK_SIZE = int(os.getenv("GCS_UPLOAD_CHUNK_SIZE") or 8 * 1024 * 1024)
+
+# Lifetime of direct-to-storage upload URLs handed to the browser
+GCS_SIGNED_URL_TTL_SECONDS = int(os.getenv("GCS_SIGNED_URL_TTL_SECONDS") or 900)
+
+_storage_client = None
+
+
+def get_storage_client():
+    """One storage.Client per process; it owns an HTTP session and credentials."""
+    global _storage_client
+    if _storage_client is None:
+        _storage_client = storage.Client()
+    return _storage_client
+
+
+def set_storage_client(client):
+    """Swap the client, e.g. for a local GCS stand-in in tests."""
+    global _storage_client
+    _storage_client = client
+
+
+def _file_size(file):
+    size = getattr(file, "size", None)
+    if size is not None:
+        return size
+    stream = file.file
+    position = stream.tell()
+    stream.seek(0, os.SEEK_END)
+    size = stream.tell() - position
+    stream.seek(position)
+    return size
+
+
+def _upload_blob(blob, stream, content_type, size):
+    if size > GCS_RESUMABLE_THRESHOLD:
+        blob.chunk_size = GCS_UPLOAD_CHUNK_SIZE
+    blob.upload_from_file(stream, content_type=content_type, size=size, rewind=True)
+
 
 async def upload_file_to_gcs(file, folder_name):
-    bucket_name = "kasadra-project-bucket"
-    storage_client = storage.Client()
-    bucket = storage_client.bucket(bucket_name)
+    bucket = get_storage_client().bucket(GCS_BUCKET_NAME)
 
     # Generate unique filename
     unique_name = f"{folder_name}/{uuid.uuid4()}_{file.filename}"
 
     blob = bucket.blob(unique_name)
-    blob.upload_from_file(file.file, content_type=file.content_type)
+    # The google client is blocking; keep it off the event loop
+    await asyncio.to_thread(_upload_blob, blob, file.file, file.content_type, _file_size(file))
+
+    return public_url(unique_name)
+
+
+#####################################################################
+## Direct-to-storage uploads (signed URLs)
+#####################################################################
+
+def public_url(object_name: str) -> str:
+    return f"https://storage.googleapis.com/{GCS_BUCKET_NAME}/{object_name}"
+
+
+def new_object_name(folder_name: str, filename: str) -> str:
+    return f"{folder_name}/{uuid.uuid4()}_{os.path.basename(filename)}"
+
+
+def _signed_upload_url(object_name, content_type):
+    blob = get_storage_client().bucket(GCS_BUCKET_NAME).blob(object_name)
+    return blob.generate_signed_url(
+        version="v4",
+        expiration=timedelta(seconds=GCS_SIGNED_URL_TTL_SECONDS),
+        method="PUT",
+        content_type=content_type,
+    )
+
+
+async def generate_upload_url(folder_name: str, filename: str, content_type: str) -> dict:
+    """Signed PUT URL the client uploads to directly; bytes skip the API."""
+    object_name = new_object_name(folder_name, filename)
+    # signing may refresh credentials over the network
+    upload_url = await asyncio.to_thread(_signed_upload_url, object_name, content_type)
+    return {
+        "object_name": object_name,
+        "upload_url": upload_url,
+        "method": "PUT",
+        "headers": {"Content-Type": content_type},
+        "expires_in": GCS_SIGNED_URL_TTL_SECONDS,
+        "file_url": public_url(object_name),
+    }
+
 
-    public_url = f"https://storage.googleapis.com/{bucket_name}/{unique_name}"
-    return public_url
+async def gcs_object_exists(object_name: str) -> bool:
+    blob = get_storage_client().bucket(GCS_BUCKET_NAME).blob(object_name)
+    return await asyncio.to_thread(blob.exists)
@@ -1,9 +1,50 @@
 # utils/passwd.py
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from passlib.context import CryptContext
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 MAX_BCRYPT_PASSWORD_BYTES = 72
 
+# bcrypt is deliberately slow (tens to hundreds of ms per call), so request
+# handlers must use the *_async helpers below, which run it on a small
+# dedicated thread pool instead of the event loop. bcrypt releases the GIL,
+# so the workers hash in parallel.
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS") or min(4, os.cpu_count() or 1))
+
+_executor = None
+
+
+class PasswordPoolMetrics:
+    def __init__(self):
+        self.submitted = 0
+        self.completed = 0
+        self.max_queue_depth = 0
+        self.wait_total = 0.0
+        self.work_total = 0.0
+
+    @property
+    def in_flight(self):
+        return self.submitted - self.completed
+
+    @property
+    def queue_depth(self):
+        # jobs submitted but not yet picked up by a worker
+        return max(self.in_flight - PASSWORD_HASH_WORKERS, 0)
+
+
+password_pool_metrics = PasswordPoolMetrics()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="passwd")
+    return _executor
+
+
 def truncate_password(password: str) -> str:
     # Encode to bytes, truncate, then decode safely
     password_bytes = password.encode("utf-8")[:MAX_BCRYPT_PASSWORD_BYTES]
@@ -16,3 +57,43 @@ def hash_password(password: str) -> str:
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     safe_password = truncate_password(plain_password)
     return pwd_context.verify(safe_password, hashed_password)
+
+
+def _timed(fn, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    return started, time.perf_counter(), result
+
+
+async def _run_in_pool(fn, *args):
+    metrics = password_pool_metrics
+    loop = asyncio.get_running_loop()
+    submitted = time.perf_counter()
+    metrics.submitted += 1
+    metrics.max_queue_depth = max(metrics.max_queue_depth, metrics.queue_depth)
+    try:
+        started, finished, result = await loop.run_in_executor(_get_executor(), _timed, fn, *args)
+    finally:
+        metrics.completed += 1
+    metrics.wait_total += started - submitted
+    metrics.work_total += finished - started
+    return result
+
+async def hash_password_async(password: str) -> str:
+    return await _run_in_pool(hash_password, password)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await _run_in_pool(verify_password, plain_password, hashed_password)
+
+
+def password_pool_stats() -> dict:
+    metrics = password_pool_metrics
+    return {
+        "workers": PASSWORD_HASH_WORKERS,
+        "in_flight": metrics.in_flight,
+        "queue_depth": metrics.queue_depth,
+        "max_queue_depth": metrics.max_queue_depth,
+        "completed": metrics.completed,
+        "wait_total_ms": round(metrics.wait_total * 1000, 3),
+        "work_total_ms": round(metrics.work_total * 1000, 3),
+    }